@@ -1,16 +1,100 @@
 # financial_planner/__init__.py
 
-from importlib.metadata import version
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-try:
-    __version__ = version("financial_planner")
-except Exception:  # pragma: no cover - fallback for missing package metadata
-    __version__ = "0.0.0"
+if TYPE_CHECKING:  # pragma: no cover - imports for static analysis only
+    from .accounts import Account
+    from .config_loader import load_yaml_config
+    from .household import Household
+    from .loan import Loan
+    from .person import Person
+    from .report_generator import generate_report
+    from .result_cache import ResultCache
+    from .scenario import Scenario, apply_overlay
+    from .schema import ScenarioValidationError, check_scenario, validate_scenario
+    from .simulation_engine import SimulationEngine
 
-from .config_loader import load_yaml_config
-from .household import Household
-from .person import Person
-from .report_generator import generate_report
-from .simulation_engine import SimulationEngine
+# Public names are resolved on first access (PEP 562) so that `import financial_planner`
+# stays cheap for short-lived processes; PyYAML and csv only load when actually used.
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "Account": ".accounts",
+    "Household": ".household",
+    "Loan": ".loan",
+    "Person": ".person",
+    "ResultCache": ".result_cache",
+    "Scenario": ".scenario",
+    "ScenarioValidationError": ".schema",
+    "SimulationEngine": ".simulation_engine",
+    "apply_overlay": ".scenario",
+    "check_scenario": ".schema",
+    "generate_report": ".report_generator",
+    "load_yaml_config": ".config_loader",
+    "validate_scenario": ".schema",
+}
 
-__all__ = ["Household", "Person", "SimulationEngine", "generate_report", "load_yaml_config"]
+__all__ = [
+    "Account",
+    "Household",
+    "Loan",
+    "Person",
+    "ResultCache",
+    "Scenario",
+    "ScenarioValidationError",
+    "SimulationEngine",
+    "apply_overlay",
+    "check_scenario",
+    "generate_report",
+    "load_yaml_config",
+    "validate_scenario",
+]
+
+
+def _resolve_version() -> str:
+    """
+    Looks up the installed package version from its metadata.
+
+    Returns:
+        str: The package version, or "0.0.0" if the metadata is unavailable.
+    """
+    from importlib.metadata import version
+
+    try:
+        return version("financial_planner")
+    except Exception:  # pragma: no cover - fallback for missing package metadata
+        return "0.0.0"
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazily imports public attributes of the package on first access.
+
+    Args:
+        name (str): The attribute being looked up.
+
+    Returns:
+        Any: The requested attribute.
+
+    Raises:
+        AttributeError: If the attribute is not part of the public API.
+    """
+    if name == "__version__":
+        value: Any = _resolve_version()
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    else:
+        message = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(message)
+
+    globals()[name] = value  # Cache so subsequent lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    Lists module attributes, including the lazily loaded public API.
+
+    Returns:
+        list[str]: The sorted attribute names.
+    """
+    return sorted(set(globals()) | set(__all__) | {"__version__"})
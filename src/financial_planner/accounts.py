@@ -0,0 +1,252 @@
+# financial_planner/accounts.py
+
+import operator
+from collections.abc import Mapping, Sequence
+from decimal import Decimal
+from itertools import accumulate
+from typing import Any, NamedTuple, Optional, Union
+
+from .decimal_utils import to_cents, to_decimal
+
+ACCOUNT_TYPES = ("401k", "ira", "brokerage", "emergency_fund")
+PRETAX_ACCOUNT_TYPES = ("401k",)
+
+# The order in which accounts are funded when leftover income cannot cover every contribution:
+# pre-tax 401k first (it lowers taxes and earns any employer match), then the emergency fund,
+# then the IRA and finally taxable brokerage accounts.
+FUNDING_PRIORITY = ("401k", "emergency_fund", "ira", "brokerage")
+
+
+class AccountProjection(NamedTuple):
+    """
+    The yearly contributions to and end-of-year balances of one account over the simulation horizon.
+    """
+
+    contributions: list[Decimal]
+    employer_contributions: list[Decimal]
+    balances: list[Decimal]
+
+
+def project_balances(initial: Decimal, deposits: Sequence[Decimal], returns: Sequence[Decimal]) -> list[Decimal]:
+    """
+    Computes the balance path of `B_t = B_(t-1) * (1 + r_t) + d_t` as a prefix recurrence.
+
+    With `G_t` the running product of `(1 + r_t)`, the recurrence unrolls to
+    `B_t = G_t * (B_0 + sum(d_i / G_i for i <= t))`, so the whole path follows from one running
+    product and one running sum instead of updating a balance object year by year.
+
+    Args:
+        initial (Decimal): The opening balance.
+        deposits (Sequence[Decimal]): The amount deposited at the end of each year.
+        returns (Sequence[Decimal]): The rate of return earned during each year.
+
+    Returns:
+        list[Decimal]: The unrounded end-of-year balances.
+    """
+    growth = list(accumulate((1 + rate for rate in returns), operator.mul))
+    discounted = accumulate((deposit / factor for deposit, factor in zip(deposits, growth)), operator.add)
+    return [factor * (initial + total) for factor, total in zip(growth, discounted)]
+
+
+class Account:
+    """
+    Represents a savings or retirement account: a pre-tax 401k with optional employer match, an IRA,
+    a taxable brokerage account, or an emergency fund.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        account_type: str,
+        owner: Optional[str] = None,
+        balance: Union[float, Decimal] = 0.0,
+        contribution: Union[float, Decimal] = 0.0,
+        contribution_rate: Union[float, Decimal] = 0.0,
+        employer_match_rate: Union[float, Decimal] = 0.0,
+        employer_match_limit: Union[float, Decimal] = 0.0,
+        return_rate: Union[float, Sequence[float]] = 0.0,
+        annual_limit: Optional[Union[float, Decimal]] = None,
+        target_balance: Optional[Union[float, Decimal]] = None,
+    ):
+        """
+        Initializes an Account instance.
+
+        Args:
+            name (str): The identifier for the account (e.g., "Jason 401k").
+            account_type (str): One of "401k", "ira", "brokerage" or "emergency_fund".
+            owner (Optional[str], optional): The name of the household member who owns the account.
+                Required for income-based contributions. Defaults to None.
+            balance (Union[float, Decimal], optional): The opening balance. Defaults to 0.0.
+            contribution (Union[float, Decimal], optional): A fixed amount contributed each year.
+                Defaults to 0.0.
+            contribution_rate (Union[float, Decimal], optional): The share of the owner's income
+                contributed each year (e.g., 0.06 for 6%). Defaults to 0.0.
+            employer_match_rate (Union[float, Decimal], optional): The employer match per dollar
+                contributed (401k only, e.g., 0.5 for 50%). Defaults to 0.0.
+            employer_match_limit (Union[float, Decimal], optional): The share of the owner's income up
+                to which contributions are matched. Defaults to 0.0.
+            return_rate (Union[float, Sequence[float]], optional): The annual rate of return, either
+                constant or one rate per simulated year; the last rate repeats. Defaults to 0.0.
+            annual_limit (Optional[Union[float, Decimal]], optional): The maximum yearly contribution
+                by the owner. Defaults to None (no limit).
+            target_balance (Optional[Union[float, Decimal]], optional): Contributions stop once the
+                balance reaches this amount, as for an emergency fund. Defaults to None.
+
+        Raises:
+            ValueError: If the account parameters are invalid.
+        """
+        if account_type not in ACCOUNT_TYPES:
+            message = f"Unknown account type {account_type!r}; expected one of {', '.join(ACCOUNT_TYPES)}."
+            raise ValueError(message)
+        if (contribution_rate or employer_match_rate) and owner is None:
+            message = f"Account {name!r} needs an owner for income-based contributions."
+            raise ValueError(message)
+        if employer_match_rate and account_type != "401k":
+            message = f"Account {name!r}: only 401k accounts can have an employer match."
+            raise ValueError(message)
+        if employer_match_rate and target_balance is not None:
+            message = f"Account {name!r}: a target balance cannot be combined with an employer match."
+            raise ValueError(message)
+
+        self.name = name
+        self.account_type = account_type
+        self.owner = owner
+        self.balance = to_decimal(balance)
+        self.contribution = to_decimal(contribution)
+        self.contribution_rate = to_decimal(contribution_rate)
+        self.employer_match_rate = to_decimal(employer_match_rate)
+        self.employer_match_limit = to_decimal(employer_match_limit)
+        rates = return_rate if isinstance(return_rate, Sequence) and not isinstance(return_rate, str) else [return_rate]
+        self.return_rates = tuple(to_decimal(rate) for rate in rates) or (Decimal(0),)
+        self.annual_limit = to_decimal(annual_limit) if annual_limit is not None else None
+        self.target_balance = to_decimal(target_balance) if target_balance is not None else None
+
+        if any(rate <= -1 for rate in self.return_rates):
+            message = f"Account {name!r}: return rates must be greater than -100%."
+            raise ValueError(message)
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "Account":
+        """
+        Creates an Account from a scenario configuration entry.
+
+        Args:
+            config (Mapping[str, Any]): A mapping with `name` and `type`, plus the optional fields
+                accepted by `Account.__init__`.
+
+        Returns:
+            Account: The configured account.
+
+        Raises:
+            KeyError: If a required field is missing.
+            ValueError: If a field has an invalid value.
+        """
+        return cls(
+            name=config["name"],
+            account_type=config["type"],
+            owner=config.get("owner"),
+            balance=config.get("balance", 0.0),
+            contribution=config.get("contribution", 0.0),
+            contribution_rate=config.get("contribution_rate", 0.0),
+            employer_match_rate=config.get("employer_match_rate", 0.0),
+            employer_match_limit=config.get("employer_match_limit", 0.0),
+            return_rate=config.get("return_rate", 0.0),
+            annual_limit=config.get("annual_limit"),
+            target_balance=config.get("target_balance"),
+        )
+
+    @property
+    def is_pretax(self) -> bool:
+        """
+        bool: Whether contributions are deducted from taxable income.
+        """
+        return self.account_type in PRETAX_ACCOUNT_TYPES
+
+    def returns_over(self, years: int) -> list[Decimal]:
+        """
+        Expands the return schedule to one rate per simulated year.
+
+        Args:
+            years (int): The number of simulated years.
+
+        Returns:
+            list[Decimal]: The rate of return for each year.
+        """
+        rates = list(self.return_rates[:years])
+        return rates + [self.return_rates[-1]] * (years - len(rates))
+
+    @property
+    def funding_priority(self) -> int:
+        """
+        int: The rank of the account in `FUNDING_PRIORITY`; lower ranks are funded first.
+        """
+        return FUNDING_PRIORITY.index(self.account_type)
+
+    def project(
+        self, owner_incomes: Sequence[Decimal], available: Optional[Sequence[Decimal]] = None
+    ) -> AccountProjection:
+        """
+        Projects contributions and balances over the simulation horizon.
+
+        Args:
+            owner_incomes (Sequence[Decimal]): The owner's income for each simulated year (zeros if
+                the account has no owner).
+            available (Optional[Sequence[Decimal]], optional): The most the owner can contribute in each
+                year, e.g. the leftover income not yet allocated to other accounts. Defaults to None
+                (no ceiling).
+
+        Returns:
+            AccountProjection: The yearly contributions and end-of-year balances, rounded to cents.
+        """
+        years = len(owner_incomes)
+        returns = self.returns_over(years)
+        contributions = [self.contribution + self.contribution_rate * income for income in owner_incomes]
+        if self.annual_limit is not None:
+            contributions = [min(amount, self.annual_limit) for amount in contributions]
+        if available is not None:
+            contributions = [max(min(amount, ceiling), Decimal(0)) for amount, ceiling in zip(contributions, available)]
+        matches = [
+            self.employer_match_rate * min(amount, self.employer_match_limit * income)
+            for amount, income in zip(contributions, owner_incomes)
+        ]
+        deposits = [amount + match for amount, match in zip(contributions, matches)]
+        balances = project_balances(self.balance, deposits, returns)
+
+        if self.target_balance is not None:
+            contributions, balances = self._cap_at_target(contributions, balances, returns)
+
+        return AccountProjection(
+            contributions=[to_cents(amount) for amount in contributions],
+            employer_contributions=[to_cents(match) for match in matches],
+            balances=[to_cents(balance) for balance in balances],
+        )
+
+    def _cap_at_target(
+        self, contributions: list[Decimal], balances: list[Decimal], returns: list[Decimal]
+    ) -> tuple[list[Decimal], list[Decimal]]:
+        """
+        Stops contributions once the balance reaches the target, topping up exactly to it.
+
+        The uncapped path matches the capped one up to the first year the target is reached, so only
+        that year's contribution is trimmed and later ones dropped before recomputing the path.
+
+        Args:
+            contributions (list[Decimal]): The uncapped yearly contributions.
+            balances (list[Decimal]): The uncapped end-of-year balances.
+            returns (list[Decimal]): The yearly rates of return.
+
+        Returns:
+            tuple[list[Decimal], list[Decimal]]: The capped contributions and balances.
+        """
+        target = self.target_balance
+        if target is None:
+            return contributions, balances
+        reached = next((year for year, balance in enumerate(balances) if balance >= target), None)
+        if reached is None:
+            return contributions, balances
+
+        previous = balances[reached - 1] if reached else self.balance
+        capped = list(contributions[:reached])
+        capped.append(max(min(target - previous * (1 + returns[reached]), contributions[reached]), Decimal(0)))
+        capped.extend(Decimal(0) for _ in contributions[reached + 1 :])
+        return capped, project_balances(self.balance, capped, returns)
@@ -0,0 +1,43 @@
+# financial_planner/decimal_utils.py
+
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from typing import Any
+
+
+def to_decimal(value: Any) -> Decimal:
+    """
+    Converts a configuration value to Decimal via its string form, avoiding binary float artifacts.
+
+    Args:
+        value (Any): The value to convert.
+
+    Returns:
+        Decimal: The converted value.
+
+    Raises:
+        ValueError: If the value is not a finite number.
+    """
+    if isinstance(value, Decimal) and value.is_finite():
+        return value  # Already converted, e.g. by the scenario schema
+    try:
+        number = Decimal(str(value))
+    except InvalidOperation as e:
+        message = f"could not convert {value!r} to a number"
+        raise ValueError(message) from e
+    if not number.is_finite():
+        message = f"could not convert {value!r} to a number"
+        raise ValueError(message)
+    return number
+
+
+def to_cents(amount: Decimal) -> Decimal:
+    """
+    Rounds an amount to whole cents.
+
+    Args:
+        amount (Decimal): The amount to round.
+
+    Returns:
+        Decimal: The amount rounded half up to two decimal places.
+    """
+    return amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
@@ -1,7 +1,11 @@
 # financial_planner/household.py
 
+from collections.abc import Mapping
 from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Optional, Union
 
+from .accounts import Account
+from .loan import Loan
 from .person import Person
 
 
@@ -11,18 +15,97 @@ class Household:
     such as living and housing costs.
     """
 
-    def __init__(self, members: list[Person], living_costs: float, housing_costs: float):
+    def __init__(
+        self,
+        members: list[Person],
+        living_costs: Union[float, Decimal],
+        housing_costs: Union[float, Decimal],
+        loans: Optional[list[Loan]] = None,
+        accounts: Optional[list[Account]] = None,
+    ):
         """
         Initializes a Household instance.
 
         Args:
             members (list[Person]): A list of Person objects representing the household members.
-            living_costs (float): Annual mandatory living expenses (e.g., groceries, utilities).
-            housing_costs (float): Annual housing-related expenses (e.g., rent, mortgage).
+            living_costs (Union[float, Decimal]): Annual mandatory living expenses (e.g., groceries, utilities).
+            housing_costs (Union[float, Decimal]): Annual housing-related expenses other than loan payments (e.g., rent,
+                property taxes, insurance).
+            loans (Optional[list[Loan]], optional): Mortgages and other loans whose payments are added to
+                housing costs each year. Defaults to None.
+            accounts (Optional[list[Account]], optional): Savings and retirement accounts funded from
+                leftover income each year. Defaults to None.
+
+        Raises:
+            ValueError: If two members or two accounts share a name, or an account is owned by an
+                unknown member.
         """
         self.members = members
         self.living_costs = Decimal(living_costs).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
         self.housing_costs = Decimal(housing_costs).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        self.loans = loans if loans is not None else []
+        self.accounts = accounts if accounts is not None else []
+
+        member_names: set[str] = set()
+        for member in members:
+            if member.name in member_names:
+                message = f"Duplicate member name {member.name!r}; member names must be unique."
+                raise ValueError(message)
+            member_names.add(member.name)
+
+        for account in self.accounts:
+            if account.owner is not None and account.owner not in member_names:
+                message = f"Account {account.name!r} is owned by unknown member {account.owner!r}."
+                raise ValueError(message)
+
+        account_names: set[str] = set()
+        for account in self.savings_accounts():
+            if account.name in account_names:
+                message = (
+                    f"Duplicate account name {account.name!r}; account names must be unique, including the "
+                    "'<member> savings' accounts generated from member savings."
+                )
+                raise ValueError(message)
+            account_names.add(account.name)
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Mapping[str, Any],
+        members: Optional[list[Person]] = None,
+        loans: Optional[list[Loan]] = None,
+        accounts: Optional[list[Account]] = None,
+    ) -> "Household":
+        """
+        Creates a Household, with its members, loans and accounts, from the `household` section of a
+        validated scenario configuration.
+
+        Args:
+            config (Mapping[str, Any]): The household mapping as coerced by the scenario schema.
+            members (Optional[list[Person]], optional): Already built members to use instead of parsing
+                `config["members"]`, e.g. those shared with a base scenario. Defaults to None.
+            loans (Optional[list[Loan]], optional): Already built loans to use instead of parsing
+                `config["loans"]`. Defaults to None.
+            accounts (Optional[list[Account]], optional): Already built accounts to use instead of
+                parsing `config["accounts"]`. Defaults to None.
+
+        Returns:
+            Household: The configured household.
+
+        Raises:
+            ValueError: If the values are well-formed but inconsistent.
+        """
+        return cls(
+            members=members if members is not None else [Person.from_config(member) for member in config["members"]],
+            living_costs=config["living_costs"],
+            housing_costs=config["housing_costs"],
+            loans=loans if loans is not None else [Loan.from_config(loan) for loan in config.get("loans", ())],
+            accounts=(
+                accounts
+                if accounts is not None
+                else [Account.from_config(account) for account in config.get("accounts", ())]
+            ),
+        )
 
     def aggregate_income(self) -> Decimal:
         """
@@ -57,6 +140,45 @@ class Household:
         print(f"[DEBUG] Total mandatory expenses: {total_expenses}.")
         return total_expenses
 
+    def loan_payments(self, year: int) -> tuple[Decimal, Decimal]:
+        """
+        Sums the interest and principal paid on all household loans during a year.
+
+        Args:
+            year (int): The calendar year.
+
+        Returns:
+            tuple[Decimal, Decimal]: The total interest and total principal paid.
+        """
+        total_interest = Decimal("0.00")
+        total_principal = Decimal("0.00")
+        for loan in self.loans:
+            interest, principal = loan.annual_payments(year)
+            total_interest += interest
+            total_principal += principal
+        print(f"[DEBUG] Loan payments for year {year}: interest {total_interest}, principal {total_principal}.")
+        return total_interest, total_principal
+
+    def savings_accounts(self) -> list[Account]:
+        """
+        Lists every account the household contributes to: the configured accounts, plus a taxable
+        brokerage account for each member with a fixed yearly `savings` amount.
+
+        Returns:
+            list[Account]: The household's accounts.
+        """
+        member_savings = [
+            Account(
+                name=f"{member.name} savings",
+                account_type="brokerage",
+                owner=member.name,
+                contribution=member.savings,
+            )
+            for member in self.members
+            if member.savings > 0
+        ]
+        return [*self.accounts, *member_savings]
+
     def apply_inflation(self, inflation_rate: float) -> None:
         """
         Applies the annual inflation rate to living and housing costs.
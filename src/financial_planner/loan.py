@@ -0,0 +1,407 @@
+# financial_planner/loan.py
+
+from collections.abc import Iterable, Mapping
+from decimal import ROUND_CEILING, Decimal
+from typing import Any, NamedTuple, Optional, Union
+
+from .decimal_utils import to_cents, to_decimal
+
+MONTHS_PER_YEAR = 12
+
+
+def _payment(balance: Decimal, rate: Decimal, months: int) -> Decimal:
+    """
+    Computes the level monthly payment that amortizes a balance over a number of months.
+
+    Args:
+        balance (Decimal): The outstanding balance.
+        rate (Decimal): The monthly interest rate.
+        months (int): The number of remaining payments.
+
+    Returns:
+        Decimal: The monthly payment.
+    """
+    if rate == 0:
+        return balance / months
+    return balance * rate / (1 - (1 + rate) ** -months)
+
+
+def _balance_after(balance: Decimal, rate: Decimal, payment: Decimal, months: int) -> Decimal:
+    """
+    Computes the balance left after a number of level payments, in closed form.
+
+    Args:
+        balance (Decimal): The opening balance.
+        rate (Decimal): The monthly interest rate.
+        payment (Decimal): The monthly payment.
+        months (int): The number of payments made.
+
+    Returns:
+        Decimal: The remaining balance, never below zero.
+    """
+    if rate == 0:
+        return max(balance - payment * months, Decimal(0))
+    growth = (1 + rate) ** months
+    return max(balance * growth - payment * (growth - 1) / rate, Decimal(0))
+
+
+def _interest_between(balance: Decimal, rate: Decimal, payment: Decimal, first: int, last: int) -> Decimal:
+    """
+    Computes the interest accrued over payments `first` to `last - 1`, in closed form.
+
+    The interest of month k is `rate * B_k`, and the balances B_k form a geometric series, so the
+    sum over any range of months reduces to a single expression.
+
+    Args:
+        balance (Decimal): The opening balance.
+        rate (Decimal): The monthly interest rate.
+        payment (Decimal): The monthly payment.
+        first (int): The first month of the range, counted from the opening balance.
+        last (int): The month after the range; must not exceed the payoff month.
+
+    Returns:
+        Decimal: The interest accrued in the range.
+    """
+    if rate == 0 or last <= first:
+        return Decimal(0)
+    span = last - first
+    return (balance - payment / rate) * (1 + rate) ** first * ((1 + rate) ** span - 1) + payment * span
+
+
+def _payoff_months(balance: Decimal, rate: Decimal, payment: Decimal, limit: int) -> int:
+    """
+    Computes how many payments are needed to retire a balance, in closed form.
+
+    Args:
+        balance (Decimal): The opening balance.
+        rate (Decimal): The monthly interest rate.
+        payment (Decimal): The monthly payment.
+        limit (int): The remaining term; the payoff never exceeds it.
+
+    Returns:
+        int: The number of payments until the balance reaches zero.
+
+    Raises:
+        ValueError: If the payment does not cover the monthly interest.
+    """
+    if balance <= 0:
+        return 0
+    if rate == 0:
+        months = balance / payment
+    else:
+        remaining_fraction = 1 - rate * balance / payment
+        if remaining_fraction <= 0:
+            message = "Loan payment does not cover the monthly interest."
+            raise ValueError(message)
+        months = -remaining_fraction.ln() / (1 + rate).ln()
+    return min(int(months.to_integral_value(rounding=ROUND_CEILING)), limit)
+
+
+class _Segment(NamedTuple):
+    """
+    A stretch of months with a constant interest rate and payment.
+    """
+
+    start: int
+    stop: int
+    rate: Decimal
+    balance: Decimal
+    payment: Decimal
+
+
+class Loan:
+    """
+    Represents an amortizing loan such as a mortgage, supporting adjustable rates, extra monthly
+    payments and refinancing.
+
+    The schedule is stored as a handful of constant-rate segments. Every yearly figure is derived
+    from closed-form amortization formulas, so the cost does not grow with the number of months.
+    """
+
+    def __init__(
+        self,
+        principal: Union[float, Decimal],
+        interest_rate: Union[float, Decimal],
+        term_years: int,
+        start_year: int,
+        extra_payment: Union[float, Decimal] = 0.0,
+        rate_changes: Optional[Iterable[Mapping[str, Any]]] = None,
+        refinances: Optional[Iterable[Mapping[str, Any]]] = None,
+    ):
+        """
+        Initializes a Loan instance.
+
+        Args:
+            principal (Union[float, Decimal]): The amount borrowed.
+            interest_rate (Union[float, Decimal]): The initial annual interest rate (e.g., 0.04 for 4%).
+            term_years (int): The length of the loan in years.
+            start_year (int): The year of the first monthly payment.
+            extra_payment (Union[float, Decimal], optional): An additional amount paid towards principal
+                each month. Defaults to 0.0.
+            rate_changes (Optional[Iterable[Mapping[str, Any]]], optional): Adjustable-rate resets, each
+                with a `year` and new `interest_rate`; the payment is recast over the remaining term.
+                Defaults to None.
+            refinances (Optional[Iterable[Mapping[str, Any]]], optional): Refinances, each with a `year`,
+                new `interest_rate`, `term_years` and optional `closing_costs` rolled into the balance.
+                Defaults to None.
+
+        Raises:
+            KeyError: If a rate change or refinance lacks a required field.
+            ValueError: If the loan parameters are invalid, including a rate change or refinance dated
+                before `start_year`, a rate change with a negative rate, or a refinance with a
+                non-positive term or negative rate or closing costs.
+        """
+        self.principal = to_decimal(principal)
+        self.interest_rate = to_decimal(interest_rate)
+        self.term_years = int(term_years)
+        self.start_year = int(start_year)
+        self.extra_payment = to_decimal(extra_payment)
+        self.rate_changes = tuple(rate_changes or ())
+        self.refinances = tuple(refinances or ())
+
+        if self.principal <= 0 or self.term_years <= 0:
+            message = "Loan principal and term must be positive."
+            raise ValueError(message)
+        if self.interest_rate < 0 or self.extra_payment < 0:
+            message = "Loan interest rate and extra payment must not be negative."
+            raise ValueError(message)
+        for event in (*self.rate_changes, *self.refinances):
+            if int(event["year"]) < self.start_year:
+                message = (
+                    f"Loan rate change or refinance in {event['year']} is before the loan starts in {self.start_year}."
+                )
+                raise ValueError(message)
+        for change in self.rate_changes:
+            if to_decimal(change["interest_rate"]) < 0:
+                message = f"Loan rate change in {change['year']} must not have a negative interest rate."
+                raise ValueError(message)
+        for refinance in self.refinances:
+            if int(refinance["term_years"]) <= 0:
+                message = f"Loan refinance in {refinance['year']} must have a positive term."
+                raise ValueError(message)
+            if to_decimal(refinance["interest_rate"]) < 0 or to_decimal(refinance.get("closing_costs", 0)) < 0:
+                message = (
+                    f"Loan refinance in {refinance['year']} must not have a negative interest rate or closing costs."
+                )
+                raise ValueError(message)
+
+        self._segments = self._build_segments()
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "Loan":
+        """
+        Creates a Loan from a scenario configuration entry.
+
+        Args:
+            config (Mapping[str, Any]): A mapping with `principal`, `interest_rate`, `term_years` and
+                `start_year`, plus optional `extra_payment`, `rate_changes` and `refinances`.
+
+        Returns:
+            Loan: The configured loan.
+
+        Raises:
+            KeyError: If a required field is missing.
+            ValueError: If a field has an invalid value.
+        """
+        return cls(
+            principal=config["principal"],
+            interest_rate=config["interest_rate"],
+            term_years=config["term_years"],
+            start_year=config["start_year"],
+            extra_payment=config.get("extra_payment", 0.0),
+            rate_changes=config.get("rate_changes"),
+            refinances=config.get("refinances"),
+        )
+
+    def _build_segments(self) -> tuple[_Segment, ...]:
+        """
+        Splits the loan into constant-rate segments at each rate change and refinance.
+
+        Returns:
+            tuple[_Segment, ...]: The segments in chronological order, ending at payoff.
+        """
+        events = sorted(
+            [(int(change["year"]), False, change) for change in self.rate_changes]
+            + [(int(refinance["year"]), True, refinance) for refinance in self.refinances],
+            key=lambda event: (event[0], event[1]),
+        )
+
+        segments = []
+        balance = self.principal
+        rate = self.interest_rate / MONTHS_PER_YEAR
+        month = 0
+        term_end = self.term_years * MONTHS_PER_YEAR
+        for event_index in range(len(events) + 1):
+            if event_index < len(events):
+                event_year, is_refinance, event = events[event_index]
+                end = min((event_year - self.start_year) * MONTHS_PER_YEAR, term_end)
+            else:
+                end = term_end
+
+            if end > month:
+                payment = _payment(balance, rate, term_end - month) + self.extra_payment
+                payoff = month + _payoff_months(balance, rate, payment, term_end - month)
+                segments.append(_Segment(month, min(end, payoff), rate, balance, payment))
+                if payoff <= end:
+                    break
+                balance = _balance_after(balance, rate, payment, end - month)
+                month = end
+
+            if event_index < len(events):
+                rate = to_decimal(event["interest_rate"]) / MONTHS_PER_YEAR
+                if is_refinance:
+                    balance += to_decimal(event.get("closing_costs", 0))
+                    term_end = month + int(event["term_years"]) * MONTHS_PER_YEAR
+
+        return tuple(segments)
+
+    def _totals_between(self, first: int, last: int) -> tuple[Decimal, Decimal]:
+        """
+        Sums interest and principal paid over a range of months since the loan started.
+
+        Args:
+            first (int): The first month of the range.
+            last (int): The month after the range.
+
+        Returns:
+            tuple[Decimal, Decimal]: The unrounded interest and principal paid.
+        """
+        interest = Decimal(0)
+        principal = Decimal(0)
+        for segment in self._segments:
+            low = max(segment.start, first) - segment.start
+            high = min(segment.stop, last) - segment.start
+            if high <= low:
+                continue
+            interest += _interest_between(segment.balance, segment.rate, segment.payment, low, high)
+            principal += _balance_after(segment.balance, segment.rate, segment.payment, low) - _balance_after(
+                segment.balance, segment.rate, segment.payment, high
+            )
+        return interest, principal
+
+    @property
+    def payoff_year(self) -> int:
+        """
+        int: The calendar year of the final payment.
+        """
+        return self.start_year + (self._segments[-1].stop - 1) // MONTHS_PER_YEAR
+
+    def annual_payments(self, year: int) -> tuple[Decimal, Decimal]:
+        """
+        Computes the interest and principal paid during a calendar year.
+
+        Args:
+            year (int): The calendar year.
+
+        Returns:
+            tuple[Decimal, Decimal]: The interest and principal paid, rounded to cents. Both are
+                zero for years before the loan starts or after it is paid off.
+        """
+        first = (year - self.start_year) * MONTHS_PER_YEAR
+        interest, principal = self._totals_between(first, first + MONTHS_PER_YEAR)
+        return to_cents(interest), to_cents(principal)
+
+    def balance_at_end_of(self, year: int) -> Decimal:
+        """
+        Computes the outstanding balance after the last payment of a calendar year.
+
+        Args:
+            year (int): The calendar year.
+
+        Returns:
+            Decimal: The remaining balance, rounded to cents.
+        """
+        month = (year - self.start_year + 1) * MONTHS_PER_YEAR
+        if month <= 0:
+            return to_cents(self.principal)
+        for segment in reversed(self._segments):
+            if month > segment.start:
+                offset = min(month, segment.stop) - segment.start
+                return to_cents(_balance_after(segment.balance, segment.rate, segment.payment, offset))
+        return to_cents(self.principal)  # pragma: no cover - the first segment always starts at month 0
+
+    def total_interest(self) -> Decimal:
+        """
+        Computes the interest paid over the life of the loan.
+
+        Returns:
+            Decimal: The total interest, rounded to cents.
+        """
+        interest, _ = self._totals_between(0, self._segments[-1].stop)
+        return to_cents(interest)
+
+    def schedule(self) -> list[dict[str, Decimal]]:
+        """
+        Builds the yearly amortization schedule from the start year to the payoff year.
+
+        Returns:
+            list[dict[str, Decimal]]: One entry per year with `year`, `interest`, `principal` and
+                the end-of-year `balance`.
+        """
+        schedule = []
+        for year in range(self.start_year, self.payoff_year + 1):
+            interest, principal = self.annual_payments(year)
+            schedule.append(
+                {
+                    "year": Decimal(year),
+                    "interest": interest,
+                    "principal": principal,
+                    "balance": self.balance_at_end_of(year),
+                }
+            )
+        return schedule
+
+    def with_refinance(self, refinance: Mapping[str, Any]) -> "Loan":
+        """
+        Creates a copy of this loan with an additional refinance.
+
+        Args:
+            refinance (Mapping[str, Any]): A mapping with `year`, `interest_rate`, `term_years` and
+                optional `closing_costs`.
+
+        Returns:
+            Loan: The refinanced loan.
+        """
+        return Loan(
+            principal=self.principal,
+            interest_rate=self.interest_rate,
+            term_years=self.term_years,
+            start_year=self.start_year,
+            extra_payment=self.extra_payment,
+            rate_changes=self.rate_changes,
+            refinances=(*self.refinances, refinance),
+        )
+
+
+def compare_refinances(loan: Loan, options: Iterable[Mapping[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Evaluates many refinance options against keeping the current loan.
+
+    Each option is priced from closed-form totals, so thousands of options can be compared
+    without stepping through any monthly schedule.
+
+    Args:
+        loan (Loan): The current loan.
+        options (Iterable[Mapping[str, Any]]): Refinance options, each with `year`, `interest_rate`,
+            `term_years` and optional `closing_costs`.
+
+    Returns:
+        list[dict[str, Any]]: One entry per option, in input order, with the `option`, its
+            `total_interest`, `closing_costs`, `total_cost` and `savings` relative to the current loan.
+    """
+    baseline = loan.total_interest()
+    comparisons = []
+    for option in options:
+        total_interest = loan.with_refinance(option).total_interest()
+        closing_costs = to_cents(to_decimal(option.get("closing_costs", 0)))
+        total_cost = total_interest + closing_costs
+        comparisons.append(
+            {
+                "option": option,
+                "total_interest": total_interest,
+                "closing_costs": closing_costs,
+                "total_cost": total_cost,
+                "savings": baseline - total_cost,
+            }
+        )
+    return comparisons
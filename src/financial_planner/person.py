@@ -1,6 +1,8 @@
 # financial_planner/person.py
 
+from collections.abc import Mapping
 from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Union
 
 
 class Person:
@@ -9,21 +11,47 @@ class Person:
     such as income and tax obligations.
     """
 
-    def __init__(self, name: str, income: float, tax_rate: float, savings: float = 0.0):
+    def __init__(
+        self,
+        name: str,
+        income: Union[float, Decimal],
+        tax_rate: Union[float, Decimal],
+        savings: Union[float, Decimal] = 0.0,
+    ):
         """
         Initializes a Person instance.
 
         Args:
             name (str): The identifier for the person (e.g., "Jason").
-            income (float): The annual income of the person.
-            tax_rate (float): The flat tax rate applicable to the person's income (e.g., 0.25 for 25%).
-            savings (float, optional): The amount allocated to savings each year. Defaults to 0.0.
+            income (Union[float, Decimal]): The annual income of the person.
+            tax_rate (Union[float, Decimal]): The flat tax rate applicable to the person's income
+                (e.g., 0.25 for 25%).
+            savings (Union[float, Decimal], optional): The amount allocated to savings each year.
+                Defaults to 0.0.
         """
         self.name = name
         self.income = Decimal(income).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
         self.tax_rate = Decimal(tax_rate).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
         self.savings = Decimal(savings).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "Person":
+        """
+        Creates a Person from a member entry of a validated scenario configuration.
+
+        Args:
+            config (Mapping[str, Any]): A member mapping as coerced by the scenario schema.
+
+        Returns:
+            Person: The configured person.
+        """
+        return cls(
+            name=config["name"],
+            income=config["income"],
+            tax_rate=config["tax_rate"],
+            savings=config.get("savings", Decimal("0")),
+        )
+
     def update_income(self, year: int) -> None:
         """
         Adjusts the person's income based on the simulation year.
@@ -0,0 +1,267 @@
+# financial_planner/result_cache.py
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .scenario import Scenario, scenario_fingerprint
+from .simulation_engine import SimulationEngine
+
+SimulationResults = list[dict[str, Decimal]]
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters describing how a ResultCache has been used.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    disk_hits: int = 0
+    disk_evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        float: The fraction of lookups served from memory or disk.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _copy_results(results: SimulationResults) -> SimulationResults:
+    """
+    Copies a list of yearly results so callers cannot mutate cached entries.
+
+    Args:
+        results (SimulationResults): The yearly financial summaries.
+
+    Returns:
+        SimulationResults: A shallow copy of each yearly summary (Decimal values are immutable).
+    """
+    return [dict(result) for result in results]
+
+
+class ResultCache:
+    """
+    A content-addressed cache of simulation results.
+
+    Results are keyed by the canonical fingerprint of the scenario config together with
+    `SimulationEngine.MODEL_VERSION`, held in a size-bounded in-memory LRU, and optionally
+    persisted to a directory on disk with its own entry limit.
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, directory: Optional[str] = None, max_disk_entries: Optional[int] = None
+    ):
+        """
+        Initializes a ResultCache instance.
+
+        Args:
+            max_entries (int, optional): The maximum number of results kept in memory. Defaults to 1024.
+            directory (Optional[str], optional): A directory for the on-disk store, created if missing.
+                Defaults to None (memory only).
+            max_disk_entries (Optional[int], optional): The maximum number of results kept on disk;
+                the least recently used files are removed first. Defaults to None (unbounded).
+
+        Raises:
+            ValueError: If an entry limit is not positive.
+        """
+        if max_entries < 1 or (max_disk_entries is not None and max_disk_entries < 1):
+            message = "Cache entry limits must be positive."
+            raise ValueError(message)
+
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, SimulationResults] = OrderedDict()
+
+    @staticmethod
+    def key_for(config: Union[Mapping[str, Any], Scenario]) -> str:
+        """
+        Computes the cache key of a scenario config for the current model version.
+
+        Args:
+            config (Union[Mapping[str, Any], Scenario]): A config dict or a resolved Scenario.
+
+        Returns:
+            str: The hex-encoded SHA-256 cache key.
+        """
+        fingerprint = config.fingerprint if isinstance(config, Scenario) else scenario_fingerprint(config)
+        versioned = f"{SimulationEngine.MODEL_VERSION}:{fingerprint}"
+        return hashlib.sha256(versioned.encode("utf-8")).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[SimulationResults]:
+        """
+        Looks up cached results, checking memory first and then the on-disk store.
+
+        Args:
+            key (str): The cache key (see `key_for`).
+
+        Returns:
+            Optional[SimulationResults]: A copy of the cached results, or None on a miss.
+        """
+        results = self._entries.get(key)
+        if results is not None:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return _copy_results(results)
+
+        results = self._read_disk(key)
+        if results is not None:
+            self.stats.hits += 1
+            self.stats.disk_hits += 1
+            self._remember(key, results)
+            return _copy_results(results)
+
+        self.stats.misses += 1
+        return None
+
+    def put(self, key: str, results: SimulationResults) -> None:
+        """
+        Stores results in memory and, if configured, on disk.
+
+        Args:
+            key (str): The cache key (see `key_for`).
+            results (SimulationResults): The yearly financial summaries to cache.
+        """
+        stored = _copy_results(results)
+        self._remember(key, stored)
+        self._write_disk(key, stored)
+
+    def clear(self) -> None:
+        """
+        Removes every in-memory entry. The on-disk store is left untouched.
+        """
+        self._entries.clear()
+
+    def run(self, config: Union[Mapping[str, Any], Scenario]) -> SimulationResults:
+        """
+        Returns the simulation results for a scenario, running the simulation only on a cache miss.
+
+        Args:
+            config (Union[Mapping[str, Any], Scenario]): A config dict or a resolved Scenario.
+
+        Returns:
+            SimulationResults: The yearly financial summaries.
+
+        Raises:
+            ValueError: If the configuration is invalid.
+        """
+        key = self.key_for(config)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        engine = SimulationEngine()
+        if isinstance(config, Scenario):
+            engine.load_resolved_scenario(config)
+        else:
+            engine.load_scenario(dict(config))
+        engine.run_simulation()
+        self.put(key, engine.results)
+        return _copy_results(engine.results)
+
+    def _remember(self, key: str, results: SimulationResults) -> None:
+        """
+        Inserts results into the in-memory LRU, evicting the least recently used entries.
+
+        Args:
+            key (str): The cache key.
+            results (SimulationResults): The results to keep; they must not be shared with callers.
+        """
+        self._entries[key] = results
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        return self.directory / f"{key}.json" if self.directory is not None else None
+
+    def _read_disk(self, key: str) -> Optional[SimulationResults]:
+        """
+        Loads results from the on-disk store, marking the file as recently used.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[SimulationResults]: The stored results, or None if absent, unreadable or malformed.
+        """
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            payload = json.loads(path.read_text())
+            results = [{name: Decimal(value) for name, value in result.items()} for result in payload["results"]]
+            os.utime(path)
+        except FileNotFoundError:
+            return None  # Absent, or evicted by another process since the lookup began
+        except (OSError, ValueError, KeyError, TypeError, AttributeError, InvalidOperation) as e:
+            print(f"[ERROR] Failed to read cached results from {path}: {e}")
+            return None
+        return results
+
+    def _write_disk(self, key: str, results: SimulationResults) -> None:
+        """
+        Writes results to the on-disk store atomically and evicts the least recently used files.
+
+        Safe to call from several processes sharing a directory: each writer uses its own temporary
+        file, and files removed concurrently are skipped during eviction.
+
+        Args:
+            key (str): The cache key.
+            results (SimulationResults): The results to persist.
+        """
+        path = self._disk_path(key)
+        if path is None or self.directory is None:
+            return
+
+        payload = {
+            "model_version": SimulationEngine.MODEL_VERSION,
+            "results": [{name: str(value) for name, value in result.items()} for result in results],
+        }
+        try:
+            # A uniquely named temporary file keeps concurrent writers from clobbering each other
+            with tempfile.NamedTemporaryFile(
+                mode="w", dir=self.directory, prefix=f".{key}.", suffix=".tmp", delete=False
+            ) as temporary:
+                json.dump(payload, temporary)
+            os.replace(temporary.name, path)
+        except OSError as e:
+            print(f"[ERROR] Failed to write cached results to {path}: {e}")
+            return
+
+        if self.max_disk_entries is None:
+            return
+        others = []
+        for file in self.directory.glob("*.json"):
+            if file == path:
+                continue
+            try:
+                others.append((file.stat().st_mtime_ns, file))
+            except FileNotFoundError:
+                continue  # Already evicted by another process
+        others.sort()
+        for _, stale in others[: max(len(others) + 1 - self.max_disk_entries, 0)]:
+            stale.unlink(missing_ok=True)
+            self.stats.disk_evictions += 1
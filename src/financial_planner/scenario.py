@@ -0,0 +1,389 @@
+# financial_planner/scenario.py
+
+import copy
+import hashlib
+import json
+from collections.abc import Iterable, Mapping, Sequence
+from decimal import ROUND_HALF_UP, Decimal
+from types import MappingProxyType
+from typing import Any, Callable, Optional, cast
+
+from .accounts import Account
+from .household import Household
+from .loan import Loan
+from .person import Person
+from .schema import validate_scenario
+
+
+def freeze_config(value: Any) -> Any:
+    """
+    Converts a configuration value into an immutable structure that can be shared safely.
+
+    Mappings become read-only `MappingProxyType` views and lists become tuples; already frozen
+    values are returned unchanged so repeated freezing does not copy.
+
+    Args:
+        value (Any): A configuration value (mapping, sequence, or scalar).
+
+    Returns:
+        Any: The immutable equivalent of the value.
+    """
+    if isinstance(value, MappingProxyType):
+        return value
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze_config(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_config(item) for item in value)
+    return value
+
+
+def _merge_named_items(key: str, base: Sequence[Any], patch: Mapping[str, Any]) -> tuple[Any, ...]:
+    """
+    Merges a patch keyed by `name` into a sequence of named mappings, such as household members.
+
+    Args:
+        key (str): The configuration key holding the sequence, used in error messages.
+        base (Sequence[Any]): The frozen sequence of mappings, each with a "name" key.
+        patch (Mapping[str, Any]): Patches keyed by item name. A value of None removes the item and
+            unknown names are appended as new items.
+
+    Returns:
+        tuple[Any, ...]: The merged sequence, reusing every untouched item.
+
+    Raises:
+        ValueError: If an item of the sequence is not a mapping with a "name" key, or an item patch
+            is not a mapping.
+    """
+    if not all(isinstance(item, Mapping) and "name" in item for item in base):
+        message = (
+            f"Cannot patch list {key!r} with a mapping: list items can only be patched by name. "
+            "Provide a list to replace it instead."
+        )
+        raise ValueError(message)
+
+    for name, item_patch in patch.items():
+        if item_patch is not None and not isinstance(item_patch, Mapping):
+            message = (
+                f"Cannot patch item {name!r} of list {key!r}: item patches must be mappings (or null to "
+                f"remove the item), got {type(item_patch).__name__}."
+            )
+            raise ValueError(message)
+
+    remaining = dict(patch)
+    merged = []
+    for item in base:
+        name = item["name"]
+        if name not in remaining:
+            merged.append(item)
+            continue
+        item_patch = remaining.pop(name)
+        if item_patch is not None:
+            merged.append(apply_overlay(item, item_patch))
+    for name, item_patch in remaining.items():
+        if item_patch is not None:
+            merged.append(freeze_config({"name": name, **item_patch}))
+    return tuple(merged)
+
+
+def apply_overlay(base: Mapping[str, Any], patch: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Applies a patch document to a base configuration with structural sharing.
+
+    Patches follow merge-patch semantics: nested mappings are merged recursively, a value of None
+    removes the key, and any other value replaces the base value. A mapping applied to a list of
+    named mappings (e.g. `household.members`) patches the items by their `name`; other lists can
+    only be replaced. Subtrees the patch does not touch are shared with the base rather than copied.
+
+    Args:
+        base (Mapping[str, Any]): The base configuration.
+        patch (Mapping[str, Any]): The overlay to apply.
+
+    Returns:
+        Mapping[str, Any]: A frozen configuration with the overlay applied.
+
+    Raises:
+        ValueError: If the patch is not a mapping, or a mapping patch targets a list whose items have
+            no `name`.
+    """
+    if not isinstance(patch, Mapping):
+        message = f"Overlay patch must be a mapping, got {type(patch).__name__}."
+        raise ValueError(message)
+
+    frozen_base = cast(Mapping[str, Any], freeze_config(base))
+    if not patch:
+        return frozen_base
+
+    merged = dict(frozen_base)
+    for key, value in patch.items():
+        current = merged.get(key)
+        if value is None:
+            merged.pop(key, None)
+        elif isinstance(value, Mapping) and isinstance(current, Mapping):
+            merged[key] = apply_overlay(current, value)
+        elif isinstance(value, Mapping) and isinstance(current, tuple):
+            merged[key] = _merge_named_items(key, current, value)
+        else:
+            merged[key] = freeze_config(value)
+    return MappingProxyType(merged)
+
+
+def _canonical_number(value: Any) -> str:
+    """
+    Formats a number so that equal values always produce the same text (e.g. 50000, 50000.0 and
+    Decimal("50000.00") all become "50000").
+
+    Args:
+        value (Any): An int, float or Decimal.
+
+    Returns:
+        str: The normalized plain-notation representation of the number.
+    """
+    number = Decimal(str(value))
+    if not number.is_finite():
+        return json.dumps(str(number))
+    if number.is_zero():
+        return "0"
+    return format(number.normalize(), "f")
+
+
+def canonical_config_json(config: Any) -> str:
+    """
+    Serializes a configuration into a canonical JSON string.
+
+    Mapping keys are sorted, numbers are normalized, and frozen and mutable containers serialize
+    identically, so configurations that describe the same scenario yield the same text.
+
+    Args:
+        config (Any): The configuration (or any nested value of it).
+
+    Returns:
+        str: The canonical JSON representation.
+    """
+    if isinstance(config, Mapping):
+        items = sorted((str(key), value) for key, value in config.items())
+        return "{" + ",".join(f"{json.dumps(key)}:{canonical_config_json(value)}" for key, value in items) + "}"
+    if isinstance(config, (list, tuple)):
+        return "[" + ",".join(canonical_config_json(item) for item in config) + "]"
+    if config is None or isinstance(config, bool):
+        return json.dumps(config)
+    if isinstance(config, (int, float, Decimal)):
+        return _canonical_number(config)
+    return json.dumps(str(config))
+
+
+def scenario_fingerprint(config: Mapping[str, Any]) -> str:
+    """
+    Computes a stable fingerprint of a configuration, independent of key order and number formatting.
+
+    Args:
+        config (Mapping[str, Any]): The configuration to fingerprint.
+
+    Returns:
+        str: The hex-encoded SHA-256 digest of the canonical JSON form of the configuration.
+    """
+    return hashlib.sha256(canonical_config_json(config).encode("utf-8")).hexdigest()
+
+
+class Scenario:
+    """
+    An immutable, fully resolved scenario configuration that can be overlaid to produce variants.
+
+    Variants share every unchanged part of their configuration with the scenario they derive from,
+    and reuse the parsed members, loans and accounts whose configuration did not change.
+    """
+
+    def __init__(self, config: Mapping[str, Any], base: Optional["Scenario"] = None):
+        """
+        Initializes a Scenario instance.
+
+        Args:
+            config (Mapping[str, Any]): The resolved scenario configuration.
+            base (Optional[Scenario], optional): The scenario this one was derived from, whose
+                compiled members, loans and accounts may be reused. Defaults to None.
+        """
+        self.config: Mapping[str, Any] = freeze_config(config)
+        self._base = base
+        self._fingerprint: Optional[str] = None
+        self._validated: Optional[dict[str, Any]] = None
+        self._compiled: dict[str, tuple[tuple[Mapping[str, Any], Any], ...]] = {}
+        self._household: Optional[Household] = None
+
+    @classmethod
+    def from_yaml(cls, filepath: str) -> "Scenario":
+        """
+        Loads a base scenario from a YAML configuration file.
+
+        Args:
+            filepath (str): The path to the YAML configuration file.
+
+        Returns:
+            Scenario: The loaded scenario.
+
+        Raises:
+            ValueError: If the file is empty.
+        """
+        from .config_loader import load_yaml_config  # Importing here to keep PyYAML optional at import time
+
+        config = load_yaml_config(filepath)
+        if config is None:
+            message = f"Scenario file {filepath} is empty."
+            raise ValueError(message)
+        return cls(config)
+
+    def overlay(self, patch: Mapping[str, Any]) -> "Scenario":
+        """
+        Creates a variant of this scenario with a patch document applied.
+
+        Args:
+            patch (Mapping[str, Any]): The overlay to apply (see `apply_overlay`).
+
+        Returns:
+            Scenario: The resolved variant.
+        """
+        return Scenario(apply_overlay(self.config, patch), base=self)
+
+    def overlay_yaml(self, filepath: str) -> "Scenario":
+        """
+        Creates a variant of this scenario from a YAML patch document.
+
+        Args:
+            filepath (str): The path to the YAML patch file. An empty file yields an identical variant.
+
+        Returns:
+            Scenario: The resolved variant.
+
+        Raises:
+            ValueError: If the document is not a valid patch (see `apply_overlay`).
+        """
+        from .config_loader import load_yaml_config  # Importing here to keep PyYAML optional at import time
+
+        return self.overlay(load_yaml_config(filepath) or {})
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        str: A stable fingerprint of the resolved configuration, suitable for deduplication and caching.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = scenario_fingerprint(self.config)
+        return self._fingerprint
+
+    @property
+    def validated(self) -> dict[str, Any]:
+        """
+        dict[str, Any]: The configuration checked and coerced by the scenario schema.
+
+        Raises:
+            ScenarioValidationError: If any field is missing or invalid; every problem is reported.
+        """
+        if self._validated is None:
+            self._validated = validate_scenario(self.config)
+        return self._validated
+
+    @property
+    def start_year(self) -> int:
+        """
+        int: The first simulated year.
+        """
+        return cast(int, self.validated["start_year"])
+
+    @property
+    def end_year(self) -> int:
+        """
+        int: The last simulated year.
+        """
+        return cast(int, self.validated["end_year"])
+
+    @property
+    def inflation_rate(self) -> Decimal:
+        """
+        Decimal: The annual inflation rate applied to household costs.
+        """
+        return cast(Decimal, self.validated["inflation_rate"]).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
+
+    def _compile_items(
+        self, key: str, factory: Callable[[Mapping[str, Any]], Any]
+    ) -> tuple[tuple[Mapping[str, Any], Any], ...]:
+        """
+        Builds the objects for a list in the household configuration (members, loans or accounts),
+        reusing those of the base scenario whose configuration object is shared.
+
+        Args:
+            key (str): The household key of the list, e.g. "loans".
+            factory (Callable[[Mapping[str, Any]], Any]): Builds an object from a validated item,
+                e.g. `Loan.from_config`.
+
+        Returns:
+            tuple[tuple[Mapping[str, Any], Any], ...]: Pairs of item configuration and built object.
+
+        Raises:
+            ScenarioValidationError: If the configuration is invalid.
+        """
+        if key in self._compiled:
+            return self._compiled[key]
+
+        inherited: dict[int, Any] = {}
+        if self._base is not None:
+            try:
+                inherited = {id(item): built for item, built in self._base._compile_items(key, factory)}
+            except ValueError:
+                inherited = {}  # An invalid base only means nothing can be reused
+
+        items = zip(self.config["household"].get(key, ()), self.validated["household"][key])
+        self._compiled[key] = tuple(
+            (item, inherited[id(item)] if id(item) in inherited else factory(validated)) for item, validated in items
+        )
+        return self._compiled[key]
+
+    def build_household(self) -> Household:
+        """
+        Builds a fresh Household for this scenario from the compiled members, loans and accounts.
+
+        Members, loans and accounts whose configuration is shared with the base scenario are reused
+        rather than parsed again. The returned household and its members are independent copies,
+        so running a simulation on them never affects other variants.
+
+        Returns:
+            Household: A new Household instance.
+
+        Raises:
+            ScenarioValidationError: If required fields are missing or have invalid values.
+            ValueError: If the values are well-formed but inconsistent (e.g. duplicate account names).
+        """
+        if self._household is None:
+            household_config = self.validated["household"]
+            compiled = {
+                key: [built for _, built in self._compile_items(key, factory)]
+                for key, factory in (
+                    ("members", Person.from_config),
+                    ("loans", Loan.from_config),
+                    ("accounts", Account.from_config),
+                )
+            }
+            try:
+                self._household = Household.from_config(household_config, **compiled)
+            except (TypeError, ValueError) as e:
+                message = f"Invalid configuration value: {e}"
+                raise ValueError(message) from e
+
+        household = copy.copy(self._household)
+        household.members = [copy.copy(member) for member in self._household.members]
+        household.loans = list(self._household.loans)  # Loans and accounts are immutable and can be shared
+        household.accounts = list(self._household.accounts)
+        return household
+
+
+def deduplicate_scenarios(scenarios: Iterable[Scenario]) -> dict[str, Scenario]:
+    """
+    Collapses identical scenario variants by fingerprint.
+
+    Args:
+        scenarios (Iterable[Scenario]): The scenarios to deduplicate.
+
+    Returns:
+        dict[str, Scenario]: The first scenario seen for each distinct fingerprint, in input order.
+    """
+    unique: dict[str, Scenario] = {}
+    for scenario in scenarios:
+        unique.setdefault(scenario.fingerprint, scenario)
+    return unique
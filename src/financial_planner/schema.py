@@ -0,0 +1,522 @@
+# financial_planner/schema.py
+
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from decimal import Decimal
+from typing import Any, Callable, NamedTuple, Union
+
+from .accounts import ACCOUNT_TYPES
+from .decimal_utils import to_decimal
+
+_MISSING = object()
+
+
+class ValidationIssue(NamedTuple):
+    """
+    A single problem found in a configuration, with the path of the offending field.
+    """
+
+    path: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}" if self.path else self.message
+
+
+class ScenarioValidationError(ValueError):
+    """
+    Raised when a scenario configuration has one or more invalid or missing fields.
+    """
+
+    def __init__(self, issues: list[ValidationIssue]):
+        """
+        Initializes a ScenarioValidationError instance.
+
+        Args:
+            issues (list[ValidationIssue]): Every problem found in the configuration.
+        """
+        self.issues = issues
+        count = f"{len(issues)} error" + ("s" if len(issues) != 1 else "")
+        super().__init__(f"Scenario configuration has {count}: " + "; ".join(str(issue) for issue in issues))
+
+
+# A compiled node takes a value, its path and the list collecting issues, and returns the coerced value.
+Validator = Callable[[Any, str, list[ValidationIssue]], Any]
+
+
+def _integer(value: Any) -> int:
+    if type(value) is int:
+        return value
+    if isinstance(value, bool):
+        message = f"expected an integer, got {value!r}"
+        raise TypeError(message)
+    return int(value)
+
+
+def _text(value: Any) -> str:
+    if type(value) is str:
+        return value
+    if not isinstance(value, (str, int)) or isinstance(value, bool):
+        message = f"expected a string, got {value!r}"
+        raise TypeError(message)
+    return str(value)
+
+
+def _rate_schedule(value: Any) -> Union[Decimal, tuple[Decimal, ...]]:
+    if isinstance(value, Sequence) and not isinstance(value, str):
+        return tuple(to_decimal(rate) for rate in value)
+    return to_decimal(value)
+
+
+def _positive(coerce: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def coerce_positive(value: Any) -> Any:
+        number = coerce(value)
+        if number <= 0:
+            message = f"must be positive, got {value!r}"
+            raise ValueError(message)
+        return number
+
+    return coerce_positive
+
+
+def _non_negative(coerce: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def coerce_non_negative(value: Any) -> Any:
+        number = coerce(value)
+        if number < 0:
+            message = f"must not be negative, got {value!r}"
+            raise ValueError(message)
+        return number
+
+    return coerce_non_negative
+
+
+def _one_of(choices: Sequence[str]) -> Callable[[Any], str]:
+    def coerce_choice(value: Any) -> str:
+        text = _text(value)
+        if text not in choices:
+            message = f"expected one of {', '.join(choices)}, got {value!r}"
+            raise ValueError(message)
+        return text
+
+    return coerce_choice
+
+
+_positive_decimal = _positive(to_decimal)
+_positive_integer = _positive(_integer)
+_non_negative_decimal = _non_negative(to_decimal)
+
+
+class Node(ABC):
+    """
+    Base class for schema nodes. A node knows whether it is required and how to compile itself.
+    """
+
+    def __init__(self, *, required: bool = True, default: Any = None):
+        """
+        Initializes a Node instance.
+
+        Args:
+            required (bool, optional): Whether the value must be present. Defaults to True.
+            default (Any, optional): The value used when an optional value is absent. Defaults to None,
+                which leaves the key out of the coerced configuration.
+        """
+        self.required = required
+        self.default = default
+
+    @abstractmethod
+    def compile(self) -> Validator:
+        """
+        Compiles the node into a validator function.
+
+        Returns:
+            Validator: The compiled validator.
+        """
+
+
+class Field(Node):
+    """
+    A scalar value converted by a coercion function.
+    """
+
+    def __init__(self, coerce: Callable[[Any], Any], *, required: bool = True, default: Any = None):
+        """
+        Initializes a Field instance.
+
+        Args:
+            coerce (Callable[[Any], Any]): Converts the raw value, raising TypeError or ValueError if invalid.
+            required (bool, optional): Whether the field must be present. Defaults to True.
+            default (Any, optional): The value used when an optional field is absent. Defaults to None.
+        """
+        super().__init__(required=required, default=default)
+        self.coerce = coerce
+
+    def compile(self) -> Validator:
+        """
+        Compiles the field into a validator function.
+
+        Returns:
+            Validator: The compiled validator.
+        """
+        coerce = self.coerce
+
+        def validate(value: Any, path: str, issues: list[ValidationIssue]) -> Any:
+            try:
+                return coerce(value)
+            except (TypeError, ValueError, ArithmeticError) as e:
+                issues.append(ValidationIssue(path, f"Invalid configuration value: {e}"))
+                return None
+
+        return validate
+
+
+class ListOf(Node):
+    """
+    A list whose items all follow the same schema.
+    """
+
+    def __init__(self, item: Node, *, required: bool = True, default: Any = ()):
+        """
+        Initializes a ListOf instance.
+
+        Args:
+            item (Node): The schema of each item.
+            required (bool, optional): Whether the list must be present. Defaults to True.
+            default (Any, optional): The value used when an optional list is absent. Defaults to ().
+        """
+        super().__init__(required=required, default=default)
+        self.item = item
+
+    def compile(self) -> Validator:
+        """
+        Compiles the list schema into a validator function.
+
+        Returns:
+            Validator: The compiled validator, returning a list of coerced items.
+        """
+        validate_item = self.item.compile()
+
+        def validate(value: Any, path: str, issues: list[ValidationIssue]) -> Any:
+            if type(value) is not list and (isinstance(value, (str, Mapping)) or not isinstance(value, Sequence)):
+                issues.append(ValidationIssue(path, f"Invalid configuration value: expected a list, got {value!r}"))
+                return []
+            return [validate_item(item, f"{path}[{index}]", issues) for index, item in enumerate(value)]
+
+        return validate
+
+
+class Record(Node):
+    """
+    A mapping with named fields. Keys the schema does not describe are passed through unchanged, and an
+    explicit null on an optional field is treated as if the field were absent.
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, Node],
+        *,
+        required: bool = True,
+        default: Any = None,
+        checks: Sequence[Validator] = (),
+    ):
+        """
+        Initializes a Record instance.
+
+        Args:
+            fields (dict[str, Node]): The schema of each known key.
+            required (bool, optional): Whether the record must be present. Defaults to True.
+            default (Any, optional): The value used when an optional record is absent. Defaults to None.
+            checks (Sequence[Validator], optional): Rules spanning several fields, run on the coerced
+                record with its path; their return values are ignored. Defaults to ().
+        """
+        super().__init__(required=required, default=default)
+        self.fields = fields
+        self.checks = tuple(checks)
+
+    def compile(self) -> Validator:
+        """
+        Compiles the record schema into a validator function.
+
+        Returns:
+            Validator: The compiled validator, returning a dict of coerced fields.
+        """
+        checks = self.checks
+        compiled = tuple((key, field.required, field.compile()) for key, field in self.fields.items())
+        # The fast path coerces scalar fields inline, saving a call per field, and falls back to the
+        # field-by-field walk, which reports every problem in schema order, when anything is wrong.
+        scalars = {key: field for key, field in self.fields.items() if isinstance(field, Field)}
+        required_scalars = tuple((key, field.coerce) for key, field in scalars.items() if field.required)
+        optional_scalars = {key: field.coerce for key, field in scalars.items() if not field.required}
+        nested = {key: validate_field for key, _, validate_field in compiled if key not in scalars}
+        required_nested = tuple(key for key in nested if self.fields[key].required)
+        defaults = tuple((key, field.default) for key, field in self.fields.items() if field.default is not None)
+
+        def validate_each_field(value: Mapping[str, Any], path: str, issues: list[ValidationIssue]) -> Any:
+            prefix = f"{path}." if path else ""
+            coerced = dict(value)
+            for key, required, validate_field in compiled:
+                raw = value.get(key)
+                if raw is None and not (required and key in value):
+                    coerced.pop(key, None)  # An explicit null on an optional field means the field is absent
+                    if required:
+                        issues.append(ValidationIssue(prefix + key, f"Missing required configuration field: '{key}'"))
+                    continue
+                coerced[key] = validate_field(raw, prefix + key, issues)
+            return coerced
+
+        def validate(value: Any, path: str, issues: list[ValidationIssue]) -> Any:
+            if type(value) is not dict and not isinstance(value, Mapping):
+                issues.append(ValidationIssue(path, f"Invalid configuration value: expected a mapping, got {value!r}"))
+                return {}
+            first_issue = len(issues)
+            coerced: dict[str, Any] = {}
+            complete = True
+            try:
+                for key, coerce in required_scalars:
+                    coerced[key] = coerce(value[key])
+                for key in required_nested:
+                    if key not in value:
+                        raise KeyError(key)
+                if len(value) > len(coerced):
+                    for key, raw in value.items():
+                        if key in coerced:
+                            continue
+                        coerce_optional = optional_scalars.get(key)
+                        if coerce_optional is not None:
+                            if raw is not None:  # An explicit null on an optional field means it is absent
+                                coerced[key] = coerce_optional(raw)
+                            continue
+                        validate_nested = nested.get(key)
+                        if validate_nested is None:
+                            coerced[key] = raw  # Keys the schema does not describe pass through
+                        elif raw is not None or key in required_nested:
+                            coerced[key] = validate_nested(raw, f"{path}.{key}" if path else key, issues)
+            except (KeyError, TypeError, ValueError, ArithmeticError):
+                complete = False
+            if not complete or len(issues) > first_issue:
+                del issues[first_issue:]
+                coerced = validate_each_field(value, path, issues)
+            for key, default in defaults:
+                coerced.setdefault(key, default)
+            for check in checks:
+                check(coerced, path, issues)
+            return coerced
+
+        return validate
+
+
+class Schema:
+    """
+    A declarative configuration schema compiled once into a single validator/coercer.
+    """
+
+    def __init__(self, root: Record):
+        """
+        Initializes a Schema instance and compiles it.
+
+        Args:
+            root (Record): The schema of the whole configuration.
+        """
+        self.root = root
+        self._validate = root.compile()
+
+    def check(self, config: Any) -> tuple[dict[str, Any], list[ValidationIssue]]:
+        """
+        Validates and coerces a configuration, collecting every problem instead of stopping at the first.
+
+        Args:
+            config (Any): The parsed configuration.
+
+        Returns:
+            tuple[dict[str, Any], list[ValidationIssue]]: The coerced configuration (only meaningful
+                when there are no issues) and the problems found.
+        """
+        issues: list[ValidationIssue] = []
+        coerced = self._validate(config, "", issues)
+        return coerced, issues
+
+    def validate(self, config: Any) -> dict[str, Any]:
+        """
+        Validates and coerces a configuration.
+
+        Args:
+            config (Any): The parsed configuration.
+
+        Returns:
+            dict[str, Any]: The configuration with every known value converted to its engine type.
+
+        Raises:
+            ScenarioValidationError: If any field is missing or invalid.
+        """
+        coerced, issues = self.check(config)
+        if issues:
+            raise ScenarioValidationError(issues)
+        return coerced
+
+
+def _check_loan_event_years(loan: Any, path: str, issues: list[ValidationIssue]) -> None:
+    """
+    Reports rate changes and refinances dated before the loan's `start_year`.
+
+    Args:
+        loan (Any): The coerced loan record.
+        path (str): The path of the loan record.
+        issues (list[ValidationIssue]): The list collecting issues.
+    """
+    start_year = loan.get("start_year")
+    if not isinstance(start_year, int):
+        return  # A missing or malformed start year is already reported
+    for key in ("rate_changes", "refinances"):
+        for index, event in enumerate(loan.get(key) or ()):
+            year = event.get("year") if isinstance(event, Mapping) else None
+            if isinstance(year, int) and year < start_year:
+                message = f"Invalid configuration value: {year} is before the loan starts in {start_year}"
+                issues.append(ValidationIssue(f"{path}.{key}[{index}].year", message))
+
+
+LOAN_SCHEMA = Record(
+    {
+        "principal": Field(_positive_decimal),
+        "interest_rate": Field(_non_negative_decimal),
+        "term_years": Field(_positive_integer),
+        "start_year": Field(_integer),
+        "extra_payment": Field(_non_negative_decimal, required=False),
+        "rate_changes": ListOf(
+            Record({"year": Field(_integer), "interest_rate": Field(_non_negative_decimal)}),
+            required=False,
+        ),
+        "refinances": ListOf(
+            Record(
+                {
+                    "year": Field(_integer),
+                    "interest_rate": Field(_non_negative_decimal),
+                    "term_years": Field(_positive_integer),
+                    "closing_costs": Field(_non_negative_decimal, required=False),
+                }
+            ),
+            required=False,
+        ),
+    },
+    checks=(_check_loan_event_years,),
+)
+
+ACCOUNT_SCHEMA = Record(
+    {
+        "name": Field(_text),
+        "type": Field(_one_of(ACCOUNT_TYPES)),
+        "owner": Field(_text, required=False),
+        "balance": Field(to_decimal, required=False),
+        "contribution": Field(_non_negative_decimal, required=False),
+        "contribution_rate": Field(_non_negative_decimal, required=False),
+        "employer_match_rate": Field(_non_negative_decimal, required=False),
+        "employer_match_limit": Field(_non_negative_decimal, required=False),
+        "return_rate": Field(_rate_schedule, required=False),
+        "annual_limit": Field(_non_negative_decimal, required=False),
+        "target_balance": Field(to_decimal, required=False),
+    }
+)
+
+
+def _check_members_and_owners(household: Any, path: str, issues: list[ValidationIssue]) -> None:
+    """
+    Reports duplicate member names, and accounts whose `owner` does not name a household member.
+
+    Args:
+        household (Any): The coerced household record.
+        path (str): The path of the household record.
+        issues (list[ValidationIssue]): The list collecting issues.
+    """
+    members = household.get("members")
+    if not members:
+        return  # Missing or malformed members are already reported
+    names = [member.get("name") for member in members]  # Coerced members are always dicts
+    member_names = set(names)
+    if len(member_names) < len(names):
+        seen: set[Any] = set()
+        for index, name in enumerate(names):
+            if name is not None and name in seen:
+                message = f"Invalid configuration value: duplicate member name {name!r}"
+                issues.append(ValidationIssue(f"{path}.members[{index}].name", message))
+            seen.add(name)
+    for index, account in enumerate(household.get("accounts") or ()):
+        owner = account.get("owner")
+        if owner is not None and owner not in member_names:
+            message = f"Invalid configuration value: owner {owner!r} is not a household member"
+            issues.append(ValidationIssue(f"{path}.accounts[{index}].owner", message))
+
+
+MEMBER_SCHEMA = Record(
+    {
+        "name": Field(_text),
+        "income": Field(to_decimal),
+        "tax_rate": Field(to_decimal),
+        "savings": Field(to_decimal, required=False, default=Decimal("0")),
+    }
+)
+
+SCENARIO_SCHEMA = Schema(
+    Record(
+        {
+            "start_year": Field(_integer),
+            "end_year": Field(_integer),
+            "inflation_rate": Field(to_decimal, required=False, default=Decimal("0")),
+            "household": Record(
+                {
+                    "living_costs": Field(to_decimal),
+                    "housing_costs": Field(to_decimal),
+                    "members": ListOf(MEMBER_SCHEMA),
+                    "loans": ListOf(LOAN_SCHEMA, required=False),
+                    "accounts": ListOf(ACCOUNT_SCHEMA, required=False),
+                },
+                checks=(_check_members_and_owners,),
+            ),
+        }
+    )
+)
+
+
+def validate_scenario(config: Any) -> dict[str, Any]:
+    """
+    Validates and coerces a scenario configuration against the compiled scenario schema.
+
+    Args:
+        config (Any): The parsed scenario configuration.
+
+    Returns:
+        dict[str, Any]: The coerced configuration, with numbers as Decimal and years as int.
+
+    Raises:
+        ScenarioValidationError: If any field is missing or invalid; every problem is reported.
+    """
+    return SCENARIO_SCHEMA.validate(config)
+
+
+def check_scenario(config: Any) -> list[ValidationIssue]:
+    """
+    Lists every problem in a scenario configuration without raising, for batch ingestion.
+
+    Args:
+        config (Any): The parsed scenario configuration.
+
+    Returns:
+        list[ValidationIssue]: The problems found, empty if the configuration is valid.
+    """
+    _, issues = SCENARIO_SCHEMA.check(config)
+    return issues
+
+
+def check_scenario_file(filepath: str) -> list[ValidationIssue]:
+    """
+    Loads a YAML scenario file and lists every problem in it.
+
+    Args:
+        filepath (str): The path to the YAML scenario file.
+
+    Returns:
+        list[ValidationIssue]: The problems found, empty if the file is valid.
+    """
+    from .config_loader import load_yaml_config  # Importing here to keep PyYAML optional at import time
+
+    config = load_yaml_config(filepath)
+    if config is None:
+        return [ValidationIssue("", f"Scenario file {filepath} is empty.")]
+    return check_scenario(config)
@@ -1,9 +1,14 @@
 # financial_planner/simulation_engine.py
 
 from decimal import ROUND_HALF_UP, Decimal
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
+from .decimal_utils import to_cents
 from .household import Household
+from .schema import validate_scenario
+
+if TYPE_CHECKING:  # pragma: no cover - imports for static analysis only
+    from .scenario import Scenario
 
 
 class SimulationEngine:
@@ -12,6 +17,10 @@ class SimulationEngine:
     updating financial states, and generating reports based on the simulation results.
     """
 
+    # Bump whenever a change to the simulation logic alters the results produced for a given config,
+    # so that cached results from older versions are not reused.
+    MODEL_VERSION = "5"
+
     def __init__(self) -> None:
         """
         Initializes a SimulationEngine instance.
@@ -21,6 +30,7 @@ class SimulationEngine:
         self.end_year: Optional[int] = None
         self.inflation_rate: Decimal = Decimal("0.00")
         self.results: list[dict[str, Decimal]] = []
+        self.account_balances: dict[str, list[Decimal]] = {}
 
     def load_scenario(self, config: dict) -> None:
         """
@@ -31,56 +41,60 @@ class SimulationEngine:
             config (Dict): A dictionary representing the parsed configuration file.
 
         Raises:
-            ValueError: If required fields are missing or have invalid values.
+            ScenarioValidationError: If required fields are missing or have invalid values; every
+                problem is reported with its path. This is a subclass of ValueError.
+            ValueError: If the values are well-formed but inconsistent (e.g. an unknown account owner).
         """
-        try:
-            self.start_year = int(config["start_year"])
-            self.end_year = int(config["end_year"])
-            self.inflation_rate = Decimal(str(config.get("inflation_rate", 0.0))).quantize(
-                Decimal("0.0001"), rounding=ROUND_HALF_UP
-            )
-
-            household_config = config["household"]
-            living_costs = float(household_config["living_costs"])
-            housing_costs = float(household_config["housing_costs"])
-            members_config = household_config["members"]
+        scenario = validate_scenario(config)
+        self.start_year = scenario["start_year"]
+        self.end_year = scenario["end_year"]
+        self.inflation_rate = scenario["inflation_rate"].quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
 
-            from .person import Person  # Importing here to avoid circular imports
+        try:
+            self.household = Household.from_config(scenario["household"])
+        except (TypeError, ValueError) as e:
+            message = f"Invalid configuration value: {e}"
+            raise ValueError(message) from e
 
-            members = []
-            for member in members_config:
-                name = member["name"]
-                income = float(member["income"])
-                tax_rate = float(member["tax_rate"])
-                savings = float(member.get("savings", 0.0))
-                members.append(Person(name=name, income=income, tax_rate=tax_rate, savings=savings))
+        print("[DEBUG] Scenario loaded successfully.")
 
-            self.household = Household(members=members, living_costs=living_costs, housing_costs=housing_costs)
+    def load_resolved_scenario(self, scenario: "Scenario") -> None:
+        """
+        Initializes simulation parameters from a resolved Scenario, reusing its compiled household
+        instead of parsing the configuration again.
 
-            print("[DEBUG] Scenario loaded successfully.")
+        Args:
+            scenario (Scenario): The resolved scenario (e.g. a base scenario or one of its overlays).
 
-        except KeyError as e:
-            message = f"Missing required configuration field: {e}"
-            raise ValueError(message) from e
-        except (TypeError, ValueError) as e:
-            message = f"Invalid configuration value: {e}"
-            raise ValueError(message) from e
+        Raises:
+            ValueError: If required fields are missing or have invalid values.
+        """
+        self.start_year = scenario.start_year
+        self.end_year = scenario.end_year
+        self.inflation_rate = scenario.inflation_rate
+        self.household = scenario.build_household()
+        print(f"[DEBUG] Scenario {scenario.fingerprint[:12]} loaded successfully.")
 
     def run_simulation(self) -> None:
         """
         Executes the multi-year financial loop, updating incomes, calculating taxes and expenses,
-        and determining naive discretionary income for each year.
+        and determining naive discretionary income for each year. Savings contributions are then
+        allocated from each year's leftover before discretionary.
         """
         if not self.household or self.start_year is None or self.end_year is None:
             message = "SimulationEngine is not properly initialized. Please load a scenario first."
             raise RuntimeError(message)
 
+        income_paths: dict[str, list[Decimal]] = {member.name: [] for member in self.household.members}
+        first_result = len(self.results)
+
         for year in range(self.start_year, self.end_year + 1):
             print(f"[DEBUG] Running simulation for year {year}.")
 
             # Update incomes
             for member in self.household.members:
                 member.update_income(year)
+                income_paths[member.name].append(member.income)
 
             # Calculate total income
             total_income = self.household.aggregate_income()
@@ -88,14 +102,15 @@ class SimulationEngine:
             # Calculate total taxes
             total_taxes = self.household.aggregate_taxes()
 
-            # Calculate total mandatory expenses
-            total_mandatory_expenses = self.household.total_mandatory_expenses()
+            # Calculate total mandatory expenses, including loan payments on top of housing costs
+            loan_interest, loan_principal = self.household.loan_payments(year)
+            total_mandatory_expenses = self.household.total_mandatory_expenses() + loan_interest + loan_principal
 
             # Determine leftover income
             leftover = (total_income - total_taxes - total_mandatory_expenses).quantize(
                 Decimal("0.01"), rounding=ROUND_HALF_UP
             )
-            naive_discretionary = leftover  # At this stage, no savings allocation
+            naive_discretionary = leftover  # Reduced by savings contributions in _allocate_savings
 
             # Capture current expenses before applying inflation
             current_living_costs = self.household.living_costs
@@ -111,6 +126,8 @@ class SimulationEngine:
                 "naive_discretionary": naive_discretionary,
                 "living_costs": current_living_costs,
                 "housing_costs": current_housing_costs,
+                "loan_interest": loan_interest,
+                "loan_principal": loan_principal,
             }
             self.results.append(year_result)
 
@@ -119,3 +136,54 @@ class SimulationEngine:
             # Apply inflation to next year's expenses if not the last year
             if self.inflation_rate > Decimal("0.00") and year < self.end_year:
                 self.household.apply_inflation(float(self.inflation_rate))
+
+        self._allocate_savings(self.results[first_result:], income_paths)
+
+    def _allocate_savings(self, year_results: list[dict[str, Decimal]], income_paths: dict[str, list[Decimal]]) -> None:
+        """
+        Projects every household account over the simulated years and deducts the contributions
+        from leftover income. Pre-tax contributions also lower each year's taxes.
+
+        Contributions never exceed the year's leftover income: accounts are funded in
+        `FUNDING_PRIORITY` order (configured order within a type) until the leftover is used up, and
+        nothing is contributed in a deficit year. Naive discretionary income is therefore only
+        negative when mandatory expenses alone exceed income after taxes.
+
+        Args:
+            year_results (list[dict[str, Decimal]]): The results of the current run, one per year.
+            income_paths (dict[str, list[Decimal]]): Each member's income for every simulated year.
+        """
+        if self.household is None:  # pragma: no cover - guarded by run_simulation
+            return
+
+        years = len(year_results)
+        no_income = [Decimal("0.00")] * years
+        tax_rates = {member.name: member.tax_rate for member in self.household.members}
+        available = [max(year_result["leftover"], Decimal("0.00")) for year_result in year_results]
+        contributions = [Decimal("0.00")] * years
+        employer_contributions = [Decimal("0.00")] * years
+        tax_savings = [Decimal("0.00")] * years
+        balances = [Decimal("0.00")] * years
+
+        self.account_balances = {}
+        for account in sorted(self.household.savings_accounts(), key=lambda account: account.funding_priority):
+            owner_incomes = income_paths[account.owner] if account.owner is not None else no_income
+            projection = account.project(owner_incomes, available)
+            self.account_balances[account.name] = projection.balances
+            for index in range(years):
+                available[index] -= projection.contributions[index]
+                contributions[index] += projection.contributions[index]
+                employer_contributions[index] += projection.employer_contributions[index]
+                balances[index] += projection.balances[index]
+                if account.is_pretax and account.owner is not None:
+                    tax_savings[index] += to_cents(projection.contributions[index] * tax_rates[account.owner])
+
+        for index, year_result in enumerate(year_results):
+            year_result["total_taxes"] -= tax_savings[index]
+            year_result["leftover"] += tax_savings[index]
+            year_result["naive_discretionary"] = year_result["leftover"] - contributions[index]
+            year_result["savings_contributions"] = contributions[index]
+            year_result["employer_contributions"] = employer_contributions[index]
+            year_result["savings_balance"] = balances[index]
+
+        print(f"[DEBUG] Allocated savings across {len(self.account_balances)} accounts.")
@@ -0,0 +1,14 @@
+# tests/conftest.py
+
+import os
+
+import pytest
+
+
+def pytest_collection_modifyitems(items):
+    if os.environ.get("RUN_BENCHMARKS") == "1":
+        return
+    skip_benchmark = pytest.mark.skip(reason="wall-clock benchmark; set RUN_BENCHMARKS=1 to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
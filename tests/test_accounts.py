@@ -0,0 +1,93 @@
+# tests/test_accounts.py
+
+from decimal import Decimal
+
+import pytest
+
+from financial_planner.accounts import Account, project_balances
+
+
+def test_project_balances_matches_yearly_recurrence():
+    deposits = [Decimal("1000"), Decimal("2000"), Decimal("0"), Decimal("500")]
+    returns = [Decimal("0.05"), Decimal("-0.10"), Decimal("0.07"), Decimal("0")]
+
+    expected = []
+    balance = Decimal("10000")
+    for deposit, rate in zip(deposits, returns):
+        balance = balance * (1 + rate) + deposit
+        expected.append(balance)
+
+    projected = project_balances(Decimal("10000"), deposits, returns)
+    assert [value.quantize(Decimal("0.0001")) for value in projected] == [
+        value.quantize(Decimal("0.0001")) for value in expected
+    ]
+
+
+def test_401k_with_employer_match():
+    account = Account(
+        name="Jason 401k",
+        account_type="401k",
+        owner="Jason",
+        contribution_rate=0.10,
+        employer_match_rate=0.5,
+        employer_match_limit=0.06,
+        return_rate=0.05,
+    )
+    projection = account.project([Decimal("100000.00"), Decimal("100000.00")])
+
+    assert account.is_pretax
+    assert projection.contributions == [Decimal("10000.00"), Decimal("10000.00")]
+    assert projection.employer_contributions == [Decimal("3000.00"), Decimal("3000.00")]
+    assert projection.balances == [Decimal("13000.00"), Decimal("26650.00")]
+
+
+def test_annual_limit_and_return_schedule():
+    account = Account(
+        name="IRA",
+        account_type="ira",
+        balance=1000,
+        contribution=10000,
+        annual_limit=7000,
+        return_rate=[0.10, 0.0],
+    )
+    projection = account.project([Decimal("0.00")] * 3)
+
+    assert not account.is_pretax
+    assert projection.contributions == [Decimal("7000.00")] * 3
+    assert projection.balances == [Decimal("8100.00"), Decimal("15100.00"), Decimal("22100.00")]
+
+
+def test_emergency_fund_stops_at_target():
+    account = Account(
+        name="Emergency",
+        account_type="emergency_fund",
+        contribution=4000,
+        target_balance=10000,
+        return_rate=0.0,
+    )
+    projection = account.project([Decimal("0.00")] * 4)
+
+    assert projection.contributions == [Decimal("4000.00"), Decimal("4000.00"), Decimal("2000.00"), Decimal("0.00")]
+    assert projection.balances[-1] == Decimal("10000.00")
+
+
+def test_contributions_limited_by_available_income():
+    account = Account(name="Brokerage", account_type="brokerage", contribution=3000, return_rate=0.1)
+    projection = account.project([Decimal("0.00")] * 3, available=[Decimal("5000"), Decimal("1000"), Decimal("-200")])
+
+    assert projection.contributions == [Decimal("3000.00"), Decimal("1000.00"), Decimal("0.00")]
+    assert projection.balances == [Decimal("3000.00"), Decimal("4300.00"), Decimal("4730.00")]
+
+
+def test_from_config_and_validation():
+    account = Account.from_config({"name": "Brokerage", "type": "brokerage", "contribution": 1200})
+    assert account.contribution == Decimal("1200")
+
+    with pytest.raises(ValueError, match="Unknown account type"):
+        Account(name="Savings", account_type="piggy_bank")
+    with pytest.raises(ValueError, match="needs an owner"):
+        Account(name="401k", account_type="401k", contribution_rate=0.05)
+    with pytest.raises(ValueError, match="only 401k accounts can have an employer match"):
+        Account(name="IRA", account_type="ira", owner="Jason", employer_match_rate=0.5)
+    with pytest.raises(KeyError):
+        Account.from_config({"name": "Missing type"})
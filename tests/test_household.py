@@ -76,3 +76,9 @@ def test_household_negative_expenses():
     household = Household(members=[member], living_costs=-1000.00, housing_costs=-500.00)
     expected_expenses = Decimal("-1000.00") + Decimal("-500.00")
     assert household.total_mandatory_expenses() == expected_expenses
+
+
+def test_household_rejects_duplicate_member_names():
+    members = [Person(name="Jason", income=80000, tax_rate=0.25), Person(name="Jason", income=60000, tax_rate=0.2)]
+    with pytest.raises(ValueError, match="Duplicate member name 'Jason'"):
+        Household(members=members, living_costs=50000, housing_costs=20000)
@@ -0,0 +1,79 @@
+# tests/test_init.py
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import financial_planner
+
+# Cold-start budgets in seconds, checked only in benchmark runs (RUN_BENCHMARKS=1). They catch
+# regressions such as an eager import of a heavy dependency.
+IMPORT_BUDGET_SECONDS = 0.25
+MINIMAL_SIMULATION_BUDGET_SECONDS = 0.5
+STARTUP_RUNS = 3
+
+STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import financial_planner
+imported = time.perf_counter()
+engine = financial_planner.SimulationEngine()
+engine.load_scenario({
+    "start_year": 2024,
+    "end_year": 2024,
+    "household": {
+        "living_costs": 50000,
+        "housing_costs": 20000,
+        "members": [{"name": "Jason", "income": 80000, "tax_rate": 0.25}],
+    },
+})
+engine.run_simulation()
+finished = time.perf_counter()
+print(json.dumps({
+    "import": imported - start,
+    "simulation": finished - start,
+    "yaml_loaded": "yaml" in sys.modules,
+    "csv_loaded": "csv" in sys.modules,
+}))
+"""
+
+
+def _run_startup_script():
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    completed = subprocess.run(  # noqa: S603 - runs the current interpreter on a fixed script
+        [sys.executable, "-c", STARTUP_SCRIPT], capture_output=True, text=True, env=env, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def test_public_api_resolves_lazily():
+    from financial_planner.simulation_engine import SimulationEngine
+
+    assert financial_planner.SimulationEngine is SimulationEngine
+    assert set(financial_planner.__all__) <= set(dir(financial_planner))
+
+
+def test_version_is_resolved():
+    assert isinstance(financial_planner.__version__, str)
+    assert "__version__" in dir(financial_planner)
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        _ = financial_planner.missing
+
+
+def test_minimal_simulation_skips_heavy_dependencies():
+    timings = _run_startup_script()
+    assert not timings["yaml_loaded"]
+    assert not timings["csv_loaded"]
+
+
+@pytest.mark.benchmark
+def test_cold_start_within_budget():
+    runs = [_run_startup_script() for _ in range(STARTUP_RUNS)]
+    assert min(run["import"] for run in runs) < IMPORT_BUDGET_SECONDS
+    assert min(run["simulation"] for run in runs) < MINIMAL_SIMULATION_BUDGET_SECONDS
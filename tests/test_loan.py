@@ -0,0 +1,156 @@
+# tests/test_loan.py
+
+from decimal import Decimal
+
+import pytest
+
+from financial_planner.loan import Loan, compare_refinances
+
+
+def monthly_reference(loan_years, rate, principal=Decimal("300000"), extra=Decimal("0")):
+    """Steps through the loan month by month to cross-check the closed-form schedule."""
+    monthly_rate = Decimal(str(rate)) / 12
+    months = loan_years * 12
+    payment = principal * monthly_rate / (1 - (1 + monthly_rate) ** -months) + extra
+    balance = principal
+    totals = {}
+    month = 0
+    while balance > 0:
+        interest = balance * monthly_rate
+        paid_principal = min(payment - interest, balance)
+        balance -= paid_principal
+        year_totals = totals.setdefault(2024 + month // 12, [Decimal(0), Decimal(0)])
+        year_totals[0] += interest
+        year_totals[1] += paid_principal
+        month += 1
+    cent = Decimal("0.01")
+    return {year: (interest.quantize(cent), paid.quantize(cent)) for year, (interest, paid) in totals.items()}
+
+
+@pytest.fixture
+def mortgage():
+    return Loan(principal=300000, interest_rate=0.06, term_years=30, start_year=2024)
+
+
+def test_fixed_rate_totals(mortgage):
+    assert mortgage.total_interest() == Decimal("347514.57")
+    assert mortgage.payoff_year == 2053
+    assert mortgage.annual_payments(2024) == (Decimal("17899.78"), Decimal("3684.04"))
+    assert mortgage.balance_at_end_of(2024) == Decimal("296315.96")
+    assert mortgage.balance_at_end_of(2053) == Decimal("0.00")
+
+
+def test_matches_monthly_reference(mortgage):
+    reference = monthly_reference(30, 0.06)
+    for year, (interest, principal) in reference.items():
+        closed_interest, closed_principal = mortgage.annual_payments(year)
+        assert abs(closed_interest - interest) <= Decimal("0.01")
+        assert abs(closed_principal - principal) <= Decimal("0.01")
+
+
+def test_extra_payment_shortens_loan():
+    loan = Loan(principal=300000, interest_rate=0.06, term_years=30, start_year=2024, extra_payment=500)
+    reference = monthly_reference(30, 0.06, extra=Decimal("500"))
+
+    assert loan.payoff_year == max(reference) == 2041
+    assert loan.total_interest() == Decimal("187219.60")
+    assert loan.annual_payments(2042) == (Decimal("0.00"), Decimal("0.00"))
+
+
+def test_years_outside_loan(mortgage):
+    assert mortgage.annual_payments(2023) == (Decimal("0.00"), Decimal("0.00"))
+    assert mortgage.balance_at_end_of(2023) == Decimal("300000.00")
+    assert mortgage.annual_payments(2054) == (Decimal("0.00"), Decimal("0.00"))
+
+
+def test_adjustable_rate_recasts_payment(mortgage):
+    adjustable = Loan(
+        principal=300000,
+        interest_rate=0.06,
+        term_years=30,
+        start_year=2024,
+        rate_changes=[{"year": 2029, "interest_rate": 0.08}],
+    )
+    assert adjustable.annual_payments(2028) == mortgage.annual_payments(2028)
+    assert adjustable.annual_payments(2029)[0] > mortgage.annual_payments(2029)[0]
+    assert adjustable.payoff_year == 2053
+    assert adjustable.total_interest() == Decimal("454306.85")
+
+
+def test_refinance_rolls_in_closing_costs(mortgage):
+    refinance = {"year": 2026, "interest_rate": 0.04, "term_years": 15, "closing_costs": 5000}
+    refinanced = mortgage.with_refinance(refinance)
+
+    assert refinanced.payoff_year == 2040
+    assert refinanced.balance_at_end_of(2025) == mortgage.balance_at_end_of(2025)
+    principal_paid = sum(entry["principal"] for entry in refinanced.schedule())
+    assert principal_paid == Decimal("305000.00")
+
+
+def test_compare_refinances(mortgage):
+    options = [
+        {"year": 2026, "interest_rate": 0.04, "term_years": 15, "closing_costs": 5000},
+        {"year": 2026, "interest_rate": 0.07, "term_years": 30},
+    ]
+    better, worse = compare_refinances(mortgage, options)
+
+    assert better["option"] is options[0]
+    assert better["total_cost"] == better["total_interest"] + Decimal("5000.00")
+    assert better["savings"] > 0
+    assert worse["savings"] < 0
+
+
+def test_zero_rate_loan():
+    loan = Loan(principal=12000, interest_rate=0, term_years=1, start_year=2024)
+    assert loan.annual_payments(2024) == (Decimal("0.00"), Decimal("12000.00"))
+    assert loan.total_interest() == Decimal("0.00")
+
+
+def test_invalid_loans():
+    with pytest.raises(ValueError, match="principal and term must be positive"):
+        Loan(principal=0, interest_rate=0.05, term_years=30, start_year=2024)
+    with pytest.raises(ValueError, match="could not convert"):
+        Loan.from_config({"principal": "lots", "interest_rate": 0.05, "term_years": 30, "start_year": 2024})
+    with pytest.raises(KeyError):
+        Loan.from_config({"principal": 1000})
+
+
+@pytest.mark.parametrize(
+    ("rate_changes", "refinances", "match"),
+    [
+        ([{"year": 2026, "interest_rate": -0.01}], None, "rate change in 2026 must not have a negative"),
+        (None, [{"year": 2026, "interest_rate": 0.05, "term_years": 0}], "refinance in 2026 must have a positive"),
+        (None, [{"year": 2026, "interest_rate": 0.05, "term_years": -5}], "refinance in 2026 must have a positive"),
+        (None, [{"year": 2026, "interest_rate": -0.05, "term_years": 15}], "refinance in 2026 must not have"),
+        (None, [{"year": 2026, "interest_rate": 0.05, "term_years": 15, "closing_costs": -1}], "must not have"),
+    ],
+)
+def test_invalid_loan_events(rate_changes, refinances, match):
+    with pytest.raises(ValueError, match=match):
+        Loan(
+            principal=300000,
+            interest_rate=0.06,
+            term_years=30,
+            start_year=2024,
+            rate_changes=rate_changes,
+            refinances=refinances,
+        )
+
+
+def test_loan_events_before_start_year():
+    with pytest.raises(ValueError, match="refinance in 2010 is before the loan starts in 2025"):
+        Loan(
+            principal=100000,
+            interest_rate=0.05,
+            term_years=10,
+            start_year=2025,
+            refinances=[{"year": 2010, "interest_rate": 0.04, "term_years": 10, "closing_costs": 50000}],
+        )
+    with pytest.raises(ValueError, match="before the loan starts"):
+        Loan(
+            principal=100000,
+            interest_rate=0.05,
+            term_years=10,
+            start_year=2025,
+            rate_changes=[{"year": 2024, "interest_rate": 0.04}],
+        )
@@ -0,0 +1,131 @@
+# tests/test_result_cache.py
+
+import tempfile
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from financial_planner.result_cache import ResultCache
+from financial_planner.scenario import Scenario, canonical_config_json
+from financial_planner.simulation_engine import SimulationEngine
+
+
+@pytest.fixture
+def sample_config():
+    return {
+        "start_year": 2024,
+        "end_year": 2025,
+        "inflation_rate": 0.02,
+        "household": {
+            "living_costs": 50000.00,
+            "housing_costs": 20000.00,
+            "members": [{"name": "Jason", "income": 80000.00, "tax_rate": 0.25}],
+        },
+    }
+
+
+def test_canonical_config_json_normalizes_numbers_and_order():
+    first = {"b": 50000, "a": [0.20, Decimal("1.50")], "c": "50000"}
+    second = {"a": (0.2, 1.5), "c": "50000", "b": 50000.00}
+    assert canonical_config_json(first) == canonical_config_json(second) == '{"a":[0.2,1.5],"b":50000,"c":"50000"}'
+
+
+def test_key_for_ignores_formatting_but_not_values(sample_config):
+    reformatted = {**sample_config, "inflation_rate": Decimal("0.020"), "start_year": 2024.0}
+    changed = {**sample_config, "inflation_rate": 0.03}
+
+    assert ResultCache.key_for(sample_config) == ResultCache.key_for(reformatted)
+    assert ResultCache.key_for(sample_config) == ResultCache.key_for(Scenario(sample_config))
+    assert ResultCache.key_for(sample_config) != ResultCache.key_for(changed)
+
+
+def test_key_for_depends_on_model_version(sample_config, monkeypatch):
+    original = ResultCache.key_for(sample_config)
+    monkeypatch.setattr(SimulationEngine, "MODEL_VERSION", "test")
+    assert ResultCache.key_for(sample_config) != original
+
+
+def test_run_caches_results(sample_config):
+    cache = ResultCache()
+    engine = SimulationEngine()
+    engine.load_scenario(sample_config)
+    engine.run_simulation()
+
+    assert cache.run(sample_config) == engine.results
+    assert cache.run(Scenario(sample_config)) == engine.results
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_cached_results_cannot_be_mutated(sample_config):
+    cache = ResultCache()
+    cache.run(sample_config)[0]["leftover"] = Decimal("0.00")
+    assert cache.run(sample_config)[0]["leftover"] != Decimal("0.00")
+
+
+def test_memory_lru_eviction(sample_config):
+    cache = ResultCache(max_entries=2)
+    keys = [ResultCache.key_for({**sample_config, "inflation_rate": rate}) for rate in (0.01, 0.02, 0.03)]
+    cache.put(keys[0], [])
+    cache.put(keys[1], [])
+    cache.get(keys[0])
+    cache.put(keys[2], [])
+
+    assert keys[0] in cache
+    assert keys[1] not in cache
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+
+
+def test_disk_store_round_trip_and_eviction(sample_config):
+    with tempfile.TemporaryDirectory() as directory:
+        first = ResultCache(directory=directory, max_disk_entries=1)
+        results = first.run(sample_config)
+
+        second = ResultCache(directory=directory, max_disk_entries=1)
+        assert second.run(sample_config) == results
+        assert second.stats.disk_hits == 1
+
+        second.run({**sample_config, "inflation_rate": 0.03})
+        assert second.stats.disk_evictions == 1
+
+        third = ResultCache(directory=directory)
+        assert third.get(ResultCache.key_for(sample_config)) is None
+
+
+@pytest.mark.parametrize("content", ["[]", '{"rows": []}', '{"results": [{"net": "lots"}]}', '{"results": 1}', "{"])
+def test_malformed_disk_entry_is_a_miss(sample_config, content):
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ResultCache(directory=directory)
+        key = ResultCache.key_for(sample_config)
+        (Path(directory) / f"{key}.json").write_text(content)
+
+        assert cache.get(key) is None
+        assert cache.stats.misses == 1
+        assert cache.run(sample_config) == ResultCache(directory=directory).run(sample_config)
+
+
+def test_disk_eviction_skips_vanished_files(sample_config, monkeypatch):
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ResultCache(directory=directory, max_disk_entries=1)
+        cache.run(sample_config)
+        vanished = Path(directory) / f"{ResultCache.key_for(sample_config)}.json"
+        original_stat = Path.stat
+
+        def stat_after_concurrent_eviction(path, **kwargs):
+            if path == vanished:
+                path.unlink(missing_ok=True)  # Another process evicted it between glob and stat
+            return original_stat(path, **kwargs)
+
+        monkeypatch.setattr(Path, "stat", stat_after_concurrent_eviction)
+        cache.run({**sample_config, "inflation_rate": 0.03})
+
+        assert cache.stats.disk_evictions == 0
+        assert not list(Path(directory).glob("*.tmp"))
+        assert len(list(Path(directory).glob("*.json"))) == 1
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError, match="Cache entry limits must be positive"):
+        ResultCache(max_entries=0)
@@ -0,0 +1,170 @@
+# tests/test_scenario.py
+
+import os
+import tempfile
+from decimal import Decimal
+
+import pytest
+
+from financial_planner.person import Person
+from financial_planner.scenario import Scenario, apply_overlay, deduplicate_scenarios
+from financial_planner.simulation_engine import SimulationEngine
+
+
+@pytest.fixture
+def base_config():
+    return {
+        "start_year": 2024,
+        "end_year": 2026,
+        "inflation_rate": 0.02,
+        "household": {
+            "living_costs": 50000.00,
+            "housing_costs": 20000.00,
+            "members": [
+                {"name": "Jason", "income": 80000.00, "tax_rate": 0.25},
+                {"name": "Linda", "income": 60000.00, "tax_rate": 0.20},
+            ],
+        },
+    }
+
+
+def test_apply_overlay_shares_unchanged_subtrees(base_config):
+    base = Scenario(base_config)
+    variant = apply_overlay(base.config, {"household": {"housing_costs": 25000}})
+
+    assert variant["household"]["housing_costs"] == 25000
+    assert base.config["household"]["housing_costs"] == 20000.00
+    assert variant["household"]["members"] is base.config["household"]["members"]
+
+
+def test_apply_overlay_patches_members_by_name(base_config):
+    base = Scenario(base_config)
+    variant = apply_overlay(base.config, {"household": {"members": {"Linda": {"income": 65000}}}})
+
+    jason, linda = variant["household"]["members"]
+    assert jason is base.config["household"]["members"][0]
+    assert linda["income"] == 65000
+    assert linda["tax_rate"] == 0.20
+
+
+def test_apply_overlay_adds_and_removes(base_config):
+    patch = {"inflation_rate": None, "household": {"members": {"Jason": None, "Sam": {"income": 1, "tax_rate": 0}}}}
+    variant = apply_overlay(base_config, patch)
+
+    assert "inflation_rate" not in variant
+    assert [member["name"] for member in variant["household"]["members"]] == ["Linda", "Sam"]
+
+
+def test_overlay_reuses_compiled_members(base_config, monkeypatch):
+    base = Scenario(base_config)
+    base.build_household()
+    variant = base.overlay({"household": {"members": {"Linda": {"income": 65000}}}})
+
+    parsed = []
+    original_from_config = Person.from_config.__func__
+    monkeypatch.setattr(
+        Person,
+        "from_config",
+        classmethod(lambda cls, config: parsed.append(config["name"]) or original_from_config(cls, config)),
+    )
+    household = variant.build_household()
+
+    assert parsed == ["Linda"]
+    assert household.members[0].income == Decimal("80000.00")
+    assert household.members[1].income == Decimal("65000.00")
+
+
+def test_overlay_reuses_unchanged_loans_and_accounts(base_config):
+    base_config["household"]["loans"] = [
+        {"principal": 300000, "interest_rate": 0.06, "term_years": 30, "start_year": 2024},
+        {"principal": 20000, "interest_rate": 0.04, "term_years": 5, "start_year": 2024},
+    ]
+    base_config["household"]["accounts"] = [{"name": "Jason IRA", "type": "ira", "owner": "Jason", "contribution": 1}]
+    base_scenario = Scenario(base_config)
+    base = base_scenario.build_household()
+    variant = base_scenario.overlay({"household": {"housing_costs": 25000}}).build_household()
+    assert variant.loans[0] is base.loans[0]
+    assert variant.loans[1] is base.loans[1]
+    assert variant.accounts[0] is base.accounts[0]
+
+    refinanced = base_scenario.overlay({"household": {"loans": [base_config["household"]["loans"][0]]}})
+    assert refinanced.build_household().loans[0] is not base.loans[0]
+
+
+def test_apply_overlay_rejects_non_mapping_patches(base_config):
+    with pytest.raises(ValueError, match="Overlay patch must be a mapping, got list"):
+        apply_overlay(base_config, [{"household": {}}])
+    with pytest.raises(ValueError, match="Cannot patch item 'Linda' of list 'members'"):
+        apply_overlay(base_config, {"household": {"members": {"Linda": [65000]}}})
+
+    with tempfile.NamedTemporaryFile(mode="w+", delete=False, suffix=".yaml") as tmp:
+        tmp.write("- housing_costs: 30000\n")
+        tmp_path = tmp.name
+    try:
+        with pytest.raises(ValueError, match="must be a mapping"):
+            Scenario(base_config).overlay_yaml(tmp_path)
+    finally:
+        os.remove(tmp_path)
+
+
+def test_apply_overlay_rejects_mapping_patch_on_unnamed_list(base_config):
+    base_config["events"] = [{"year": 2025, "type": "new_child"}]
+    with pytest.raises(ValueError, match="list items can only be patched by name"):
+        apply_overlay(base_config, {"events": {"new_child": {"year": 2026}}})
+
+    replaced = apply_overlay(base_config, {"events": [{"year": 2026, "type": "new_child"}]})
+    assert replaced["events"][0]["year"] == 2026
+
+
+def test_build_household_returns_independent_copies(base_config):
+    scenario = Scenario(base_config)
+    first = scenario.build_household()
+    first.members[0].update_income(2024)
+    first.apply_inflation(0.02)
+
+    second = scenario.build_household()
+    assert second.members[0].income == Decimal("80000.00")
+    assert second.housing_costs == Decimal("20000.00")
+
+
+def test_fingerprint_deduplicates_identical_variants(base_config):
+    base = Scenario(base_config)
+    same = base.overlay({"household": {"housing_costs": 20000.00}})
+    different = base.overlay({"household": {"housing_costs": 25000}})
+
+    assert same.fingerprint == base.fingerprint
+    assert different.fingerprint != base.fingerprint
+    assert list(deduplicate_scenarios([base, same, different])) == [base.fingerprint, different.fingerprint]
+
+
+def test_overlay_matches_load_scenario(base_config):
+    variant = Scenario(base_config).overlay({"household": {"members": {"Jason": {"tax_rate": 0.3}}}})
+    overlay_engine = SimulationEngine()
+    overlay_engine.load_resolved_scenario(variant)
+    overlay_engine.run_simulation()
+
+    base_config["household"]["members"][0]["tax_rate"] = 0.3
+    plain_engine = SimulationEngine()
+    plain_engine.load_scenario(base_config)
+    plain_engine.run_simulation()
+
+    assert overlay_engine.results == plain_engine.results
+
+
+def test_load_resolved_scenario_invalid_value(base_config):
+    variant = Scenario(base_config).overlay({"household": {"members": {"Linda": {"income": "a lot"}}}})
+    engine = SimulationEngine()
+    with pytest.raises(ValueError, match="Invalid configuration value"):
+        engine.load_resolved_scenario(variant)
+
+
+def test_overlay_yaml(base_config):
+    with tempfile.NamedTemporaryFile(mode="w+", delete=False, suffix=".yaml") as tmp:
+        tmp.write("household:\n  housing_costs: 30000\n")
+        tmp_path = tmp.name
+
+    try:
+        variant = Scenario(base_config).overlay_yaml(tmp_path)
+        assert variant.build_household().housing_costs == Decimal("30000.00")
+    finally:
+        os.remove(tmp_path)
@@ -0,0 +1,195 @@
+# tests/test_schema.py
+
+import os
+import tempfile
+import timeit
+from decimal import Decimal
+
+import pytest
+
+from financial_planner.accounts import Account
+from financial_planner.household import Household
+from financial_planner.schema import (
+    ScenarioValidationError,
+    ValidationIssue,
+    check_scenario,
+    check_scenario_file,
+    validate_scenario,
+)
+from financial_planner.simulation_engine import SimulationEngine
+
+# Validation coerces every value once, so building the household afterwards parses no numbers. On a
+# config without loans (whose amortization would dominate), validating must cost less than building the
+# household straight from the raw config. The absolute per-scenario budget for batch ingestion is checked
+# only in benchmark runs (RUN_BENCHMARKS=1), as wall-clock limits are noisy on CI.
+VALIDATION_BUDGET_SECONDS = 0.0005
+VALIDATION_SHARE_OF_BUILD = 1.0
+BENCHMARK_ROUNDS = 200
+
+
+@pytest.fixture
+def sample_config():
+    return {
+        "start_year": 2024,
+        "end_year": 2026,
+        "inflation_rate": 0.02,
+        "events": [{"year": 2025, "type": "new_child"}],
+        "household": {
+            "living_costs": 50000.00,
+            "housing_costs": 20000.00,
+            "members": [
+                {"name": "Jason", "income": 80000.00, "tax_rate": 0.25},
+                {"name": "Linda", "income": "60000.10", "tax_rate": 0.20},
+            ],
+            "loans": [{"principal": 300000, "interest_rate": 0.06125, "term_years": 30, "start_year": 2025}],
+        },
+    }
+
+
+@pytest.fixture
+def benchmark_config(sample_config):
+    del sample_config["household"]["loans"]
+    return sample_config
+
+
+def test_validate_scenario_coerces_to_engine_types(sample_config):
+    validated = validate_scenario(sample_config)
+
+    assert validated["start_year"] == 2024
+    assert validated["inflation_rate"] == Decimal("0.02")
+    members = validated["household"]["members"]
+    assert members[0]["income"] == Decimal("80000.0")
+    assert members[1]["income"] == Decimal("60000.10")
+    assert members[1]["savings"] == Decimal("0")
+    assert validated["household"]["loans"][0]["interest_rate"] == Decimal("0.06125")
+    assert validated["household"]["accounts"] == ()
+    assert validated["events"] == sample_config["events"]
+
+
+def test_check_scenario_reports_every_issue_with_paths(sample_config):
+    del sample_config["end_year"]
+    sample_config["household"]["members"].append({"name": "Sam", "income": "lots"})
+    sample_config["household"]["loans"][0]["term_years"] = "thirty"
+
+    issues = check_scenario(sample_config)
+
+    assert [issue.path for issue in issues] == [
+        "end_year",
+        "household.members[2].income",
+        "household.members[2].tax_rate",
+        "household.loans[0].term_years",
+    ]
+    assert issues[0].message == "Missing required configuration field: 'end_year'"
+    assert issues[1].message.startswith("Invalid configuration value")
+
+
+def test_check_scenario_wrong_container_types():
+    issues = check_scenario({"start_year": 2024, "end_year": 2025, "household": {"members": "Jason"}})
+    assert ValidationIssue("household.members", "Invalid configuration value: expected a list, got 'Jason'") in issues
+    assert check_scenario([]) == [ValidationIssue("", "Invalid configuration value: expected a mapping, got []")]
+
+
+def test_validation_error_lists_all_issues(sample_config):
+    del sample_config["start_year"]
+    sample_config["household"]["members"][0]["tax_rate"] = None
+    engine = SimulationEngine()
+
+    with pytest.raises(ScenarioValidationError, match="2 errors") as excinfo:
+        engine.load_scenario(sample_config)
+    assert "household.members[0].tax_rate: Invalid configuration value" in str(excinfo.value)
+    assert isinstance(excinfo.value, ValueError)
+
+
+def test_check_scenario_file():
+    with tempfile.NamedTemporaryFile(mode="w+", delete=False, suffix=".yaml") as tmp:
+        tmp.write("start_year: 2024\nhousehold:\n  living_costs: 1\n")
+        tmp_path = tmp.name
+
+    try:
+        paths = [issue.path for issue in check_scenario_file(tmp_path)]
+        assert paths == ["end_year", "household.housing_costs", "household.members"]
+    finally:
+        os.remove(tmp_path)
+
+
+def test_check_scenario_reports_domain_rules_with_paths(sample_config):
+    household = sample_config["household"]
+    household["loans"][0].update(
+        principal=0,
+        term_years=-5,
+        interest_rate=-0.01,
+        rate_changes=[{"year": 2027, "interest_rate": -0.02}],
+        refinances=[{"year": 2030, "interest_rate": 0.04, "term_years": 0}],
+    )
+    household["accounts"] = [
+        {"name": "Piggy bank", "type": "piggy_bank"},
+        {"name": "Sam IRA", "type": "ira", "owner": "Sam", "contribution_rate": -0.05},
+    ]
+
+    issues = check_scenario(sample_config)
+
+    assert [issue.path for issue in issues] == [
+        "household.loans[0].principal",
+        "household.loans[0].interest_rate",
+        "household.loans[0].term_years",
+        "household.loans[0].rate_changes[0].interest_rate",
+        "household.loans[0].refinances[0].term_years",
+        "household.accounts[0].type",
+        "household.accounts[1].contribution_rate",
+        "household.accounts[1].owner",
+    ]
+    assert issues[0].message == "Invalid configuration value: must be positive, got 0"
+    assert issues[1].message == "Invalid configuration value: must not be negative, got -0.01"
+    assert "expected one of 401k, ira, brokerage, emergency_fund" in issues[5].message
+    assert issues[7].message == "Invalid configuration value: owner 'Sam' is not a household member"
+
+
+def test_check_scenario_reports_loan_events_before_start(sample_config):
+    sample_config["household"]["loans"][0]["rate_changes"] = [{"year": 2030, "interest_rate": 0.05}]
+    sample_config["household"]["loans"][0]["refinances"] = [{"year": 2020, "interest_rate": 0.04, "term_years": 15}]
+
+    assert check_scenario(sample_config) == [
+        ValidationIssue(
+            "household.loans[0].refinances[0].year",
+            "Invalid configuration value: 2020 is before the loan starts in 2025",
+        )
+    ]
+
+
+def test_optional_fields_accept_null(sample_config):
+    sample_config["inflation_rate"] = None
+    sample_config["household"]["members"][0]["savings"] = None
+    sample_config["household"]["accounts"] = [
+        {"name": "Brokerage", "type": "brokerage", "owner": None, "contribution": 100, "annual_limit": None}
+    ]
+
+    validated = validate_scenario(sample_config)
+
+    assert validated["inflation_rate"] == Decimal("0")
+    assert validated["household"]["members"][0]["savings"] == Decimal("0")
+    assert validated["household"]["accounts"][0] == {"name": "Brokerage", "type": "brokerage", "contribution": 100}
+    assert Account.from_config(validated["household"]["accounts"][0]).annual_limit is None
+
+
+def test_check_scenario_missing_nested_record():
+    assert check_scenario({"start_year": 2024, "end_year": 2025}) == [
+        ValidationIssue("household", "Missing required configuration field: 'household'")
+    ]
+
+
+def _validation_and_build_seconds(config):
+    household = config["household"]
+    validation = min(timeit.repeat(lambda: validate_scenario(config), number=BENCHMARK_ROUNDS, repeat=5))
+    building = min(timeit.repeat(lambda: Household.from_config(household), number=BENCHMARK_ROUNDS, repeat=5))
+    return validation, building
+
+
+def test_validation_cheaper_than_building(benchmark_config):
+    validation, building = _validation_and_build_seconds(benchmark_config)
+    assert validation / building < VALIDATION_SHARE_OF_BUILD
+
+
+@pytest.mark.benchmark
+def test_validation_cost_within_budget(benchmark_config):
+    validation, _ = _validation_and_build_seconds(benchmark_config)
+    assert validation / BENCHMARK_ROUNDS < VALIDATION_BUDGET_SECONDS
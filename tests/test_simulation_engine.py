@@ -132,3 +132,115 @@ def test_run_simulation_not_initialized():
     engine = SimulationEngine()
     with pytest.raises(RuntimeError, match="SimulationEngine is not properly initialized"):
         engine.run_simulation()
+
+
+def test_run_simulation_with_mortgage(sample_config):
+    sample_config["household"]["loans"] = [
+        {"principal": 300000, "interest_rate": 0.06, "term_years": 30, "start_year": 2025}
+    ]
+    engine = SimulationEngine()
+    engine.load_scenario(sample_config)
+    engine.run_simulation()
+
+    year1, year2, _ = engine.results
+    assert year1["loan_interest"] == year1["loan_principal"] == Decimal("0.00")
+    assert year1["total_mandatory_expenses"] == Decimal("70000.00")
+
+    assert (year2["loan_interest"], year2["loan_principal"]) == (Decimal("17899.78"), Decimal("3684.04"))
+    assert year2["total_mandatory_expenses"] == Decimal("71400.00") + Decimal("17899.78") + Decimal("3684.04")
+    assert year2["housing_costs"] == Decimal("20400.00")
+
+
+def test_load_scenario_invalid_loan(sample_config):
+    sample_config["household"]["loans"] = [{"principal": 300000, "interest_rate": 0.06, "start_year": 2025}]
+    engine = SimulationEngine()
+    with pytest.raises(ValueError, match="Missing required configuration field: 'term_years'"):
+        engine.load_scenario(sample_config)
+
+
+def test_run_simulation_with_savings_accounts(sample_config):
+    sample_config["household"]["accounts"] = [
+        {
+            "name": "Jason 401k",
+            "type": "401k",
+            "owner": "Jason",
+            "contribution_rate": 0.06,
+            "employer_match_rate": 0.5,
+            "employer_match_limit": 0.06,
+            "return_rate": 0.05,
+        }
+    ]
+    sample_config["household"]["members"][1]["savings"] = 1000.00
+    engine = SimulationEngine()
+    engine.load_scenario(sample_config)
+    engine.run_simulation()
+
+    year1, year2, _ = engine.results
+    # Jason contributes 6% of 82400 = 4944 pre-tax, saving 4944 * 0.25 = 1236 in taxes
+    assert year1["total_taxes"] == Decimal("31724.00")
+    assert year1["leftover"] == Decimal("42476.00")
+    assert year1["savings_contributions"] == Decimal("5944.00")  # 4944 + Linda's 1000 savings
+    assert year1["employer_contributions"] == Decimal("2472.00")
+    assert year1["naive_discretionary"] == Decimal("36532.00")
+    assert year1["savings_balance"] == Decimal("8416.00")
+
+    # 401k: 7416 * 1.05 + 5092.32 + 2546.16 = 15425.28
+    assert engine.account_balances["Jason 401k"][1] == Decimal("15425.28")
+    assert engine.account_balances["Linda savings"] == [Decimal("1000.00"), Decimal("2000.00"), Decimal("3000.00")]
+    assert year2["savings_balance"] == Decimal("17425.28")
+
+
+def test_load_scenario_account_with_unknown_owner(sample_config):
+    sample_config["household"]["accounts"] = [{"name": "IRA", "type": "ira", "owner": "Sam", "contribution": 1}]
+    engine = SimulationEngine()
+    with pytest.raises(ValueError, match=r"household\.accounts\[0\]\.owner: .*'Sam' is not a household member"):
+        engine.load_scenario(sample_config)
+
+
+def test_savings_capped_at_leftover_by_funding_priority(sample_config):
+    sample_config["household"]["accounts"] = [
+        {"name": "Brokerage", "type": "brokerage", "contribution": 30000},
+        {"name": "Emergency fund", "type": "emergency_fund", "contribution": 20000},
+        {"name": "Jason 401k", "type": "401k", "owner": "Jason", "contribution_rate": 0.06},
+    ]
+    engine = SimulationEngine()
+    engine.load_scenario(sample_config)
+    engine.run_simulation()
+
+    year1 = engine.results[0]
+    # 41240 of leftover before tax savings funds the 401k (4944), the emergency fund (20000) and
+    # what remains of the brokerage contribution (16296); the 1236 saved in taxes stays discretionary.
+    assert engine.account_balances["Jason 401k"][0] == Decimal("4944.00")
+    assert engine.account_balances["Emergency fund"][0] == Decimal("20000.00")
+    assert engine.account_balances["Brokerage"][0] == Decimal("16296.00")
+    assert year1["savings_contributions"] == Decimal("41240.00")
+    assert year1["naive_discretionary"] == Decimal("1236.00")
+    assert all(result["naive_discretionary"] >= 0 for result in engine.results)
+
+
+def test_no_savings_in_deficit_year(sample_config):
+    sample_config["household"]["housing_costs"] = 100000.00
+    sample_config["household"]["members"][0]["savings"] = 5000.00
+    engine = SimulationEngine()
+    engine.load_scenario(sample_config)
+    engine.run_simulation()
+
+    year1 = engine.results[0]
+    assert year1["leftover"] < 0
+    assert year1["savings_contributions"] == Decimal("0.00")
+    assert year1["naive_discretionary"] == year1["leftover"]
+
+
+def test_load_scenario_duplicate_account_name(sample_config):
+    sample_config["household"]["members"][0]["savings"] = 1000.00
+    sample_config["household"]["accounts"] = [{"name": "Jason savings", "type": "brokerage", "contribution": 1}]
+    engine = SimulationEngine()
+    with pytest.raises(ValueError, match="Duplicate account name 'Jason savings'"):
+        engine.load_scenario(sample_config)
+
+
+def test_load_scenario_duplicate_member_name(sample_config):
+    sample_config["household"]["members"][1]["name"] = "Jason"
+    engine = SimulationEngine()
+    with pytest.raises(ValueError, match=r"household\.members\[1\]\.name: .*duplicate member name 'Jason'"):
+        engine.load_scenario(sample_config)